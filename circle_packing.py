@@ -4,8 +4,9 @@ Creates densely packed circles that don't overlap
 """
 
 import numpy as np
+from collections import defaultdict
 import matplotlib.pyplot as plt
-from matplotlib.patches import Circle
+from matplotlib.collections import EllipseCollection
 
 # Parameters
 NUM_CIRCLES = 1000
@@ -13,6 +14,7 @@ MIN_RADIUS = 0.02
 MAX_RADIUS = 0.3
 CANVAS_SIZE = 10
 MAX_ATTEMPTS = 1000
+CANDIDATE_BATCH = 10000  # Random candidates drawn per RNG call
 COLORMAP = 'hsv'
 COLOR_BY = 'size'  # 'size', 'position', or 'random'
 BACKGROUND = '#0a0a0a'
@@ -22,39 +24,73 @@ ALPHA = 0.8
 DPI = 150
 OUTPUT_FILE = 'circle_packing.jpg'
 
-def check_collision(x, y, r, circles):
-    """Check if new circle collides with existing ones"""
-    for cx, cy, cr in circles:
-        dist = np.sqrt((x - cx)**2 + (y - cy)**2)
-        if dist < r + cr:
-            return True
+# Spatial hash cell size: colliding circles are never more than one cell apart
+CELL_SIZE = 2 * MAX_RADIUS
+
+def grid_cell(x, y):
+    """Spatial hash key of the cell containing (x, y)"""
+    return int(x // CELL_SIZE), int(y // CELL_SIZE)
+
+def check_collision(x, y, r, grid):
+    """Check if new circle collides with existing ones in neighboring cells"""
+    gx, gy = grid_cell(x, y)
+    for i in (gx - 1, gx, gx + 1):
+        for j in (gy - 1, gy, gy + 1):
+            for cx, cy, cr in grid.get((i, j), ()):
+                # Compare squared distances so no sqrt is needed
+                dx = x - cx
+                dy = y - cy
+                if dx*dx + dy*dy < (r + cr)**2:
+                    return True
     return False
 
+def draw_candidates(n):
+    """Draw a batch of random candidate circles (x, y, r)"""
+    x = np.random.uniform(-CANVAS_SIZE/2, CANVAS_SIZE/2, n)
+    y = np.random.uniform(-CANVAS_SIZE/2, CANVAS_SIZE/2, n)
+    r = np.random.uniform(MIN_RADIUS, MAX_RADIUS, n)
+    return x, y, r
+
 def create_circle_packing():
     """Create circle packing art"""
     
     print("Packing circles...")
     
-    circles = []
+    # Preallocated circle storage, first k entries are valid
+    xs = np.empty(NUM_CIRCLES)
+    ys = np.empty(NUM_CIRCLES)
+    rs = np.empty(NUM_CIRCLES)
+    k = 0
     attempts = 0
     
-    while len(circles) < NUM_CIRCLES and attempts < NUM_CIRCLES * MAX_ATTEMPTS:
-        # Random position
-        x = np.random.uniform(-CANVAS_SIZE/2, CANVAS_SIZE/2)
-        y = np.random.uniform(-CANVAS_SIZE/2, CANVAS_SIZE/2)
+    # Spatial hash of packed circles, keyed by grid cell
+    grid = defaultdict(list)
+    
+    # Candidates are drawn in batches to amortize RNG overhead
+    cand_x, cand_y, cand_r = draw_candidates(CANDIDATE_BATCH)
+    c = 0
+    
+    while k < NUM_CIRCLES and attempts < NUM_CIRCLES * MAX_ATTEMPTS:
+        if c == CANDIDATE_BATCH:
+            cand_x, cand_y, cand_r = draw_candidates(CANDIDATE_BATCH)
+            c = 0
         
-        # Start with max radius and shrink if needed
-        r = np.random.uniform(MIN_RADIUS, MAX_RADIUS)
+        # Random position and radius
+        x, y, r = float(cand_x[c]), float(cand_y[c]), float(cand_r[c])
+        c += 1
         
         # Check if it fits
-        if not check_collision(x, y, r, circles):
-            circles.append((x, y, r))
-            if len(circles) % 100 == 0:
-                print(f"  Packed {len(circles)} circles...")
+        if not check_collision(x, y, r, grid):
+            grid[grid_cell(x, y)].append((x, y, r))
+            xs[k], ys[k], rs[k] = x, y, r
+            k += 1
+            if k % 100 == 0:
+                print(f"  Packed {k} circles...")
         
         attempts += 1
     
-    print(f"Successfully packed {len(circles)} circles")
+    xs, ys, rs = xs[:k], ys[:k], rs[:k]
+    print(f"Successfully packed {k} circles")
     print("Creating visualization...")
     
     # Create figure
@@ -62,25 +98,25 @@ def create_circle_packing():
     fig.patch.set_facecolor(BACKGROUND)
     ax.set_facecolor(BACKGROUND)
     
-    cmap = plt.get_cmap(COLORMAP)
+    # Determine colors for all circles at once
+    if COLOR_BY == 'size':
+        color_vals = (rs - MIN_RADIUS) / (MAX_RADIUS - MIN_RADIUS)
+    elif COLOR_BY == 'position':
+        dist = np.sqrt(xs**2 + ys**2)
+        color_vals = dist / (CANVAS_SIZE / 2)
+    else:  # random
+        color_vals = np.random.rand(k)
     
-    # Draw circles
-    for i, (x, y, r) in enumerate(circles):
-        # Determine color
-        if COLOR_BY == 'size':
-            color_val = (r - MIN_RADIUS) / (MAX_RADIUS - MIN_RADIUS)
-        elif COLOR_BY == 'position':
-            dist = np.sqrt(x**2 + y**2)
-            color_val = dist / (CANVAS_SIZE / 2)
-        else:  # random
-            color_val = np.random.rand()
-        
-        color = cmap(color_val)
-        
-        circle = Circle((x, y), r, facecolor=color, 
-                       edgecolor=EDGE_COLOR if EDGE_COLOR else color,
-                       linewidth=EDGE_WIDTH, alpha=ALPHA)
-        ax.add_patch(circle)
+    # Draw circles as a single collection sized in data units
+    diameters = 2 * rs
+    ec = EllipseCollection(diameters, diameters, 0, units='xy',
+                          offsets=np.column_stack([xs, ys]),
+                          offset_transform=ax.transData,
+                          cmap=COLORMAP, norm=plt.Normalize(0, 1),
+                          edgecolors=EDGE_COLOR if EDGE_COLOR else 'face',
+                          linewidths=EDGE_WIDTH, alpha=ALPHA)
+    ec.set_array(color_vals)
+    ax.add_collection(ec)
     
     ax.set_xlim(-CANVAS_SIZE/2, CANVAS_SIZE/2)
     ax.set_ylim(-CANVAS_SIZE/2, CANVAS_SIZE/2)
@@ -5,6 +5,7 @@ Creates chaotic concentric circles with noise-based deformations
 
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 
 # Parameters
 NUM_CIRCLES = 100
@@ -29,32 +30,30 @@ def create_concentric_chaos():
     
     cmap = plt.get_cmap(COLORMAP)
     
-    # Generate deformed circles
-    for i in range(NUM_CIRCLES):
-        radius = 0.1 + i * 0.09
-        
-        # Parametric angle
-        theta = np.linspace(0, 2 * np.pi, POINTS_PER_CIRCLE)
-        
-        # Add multiple noise frequencies
-        noise = 0
-        for freq in range(1, NOISE_FREQUENCY):
-            phase = np.random.rand() * 2 * np.pi
-            amplitude = NOISE_AMPLITUDE / freq
-            noise += amplitude * np.sin(freq * theta + phase)
-        
-        # Apply noise to radius
-        r = radius * (1 + noise)
-        
-        # Convert to Cartesian
-        x = r * np.cos(theta)
-        y = r * np.sin(theta)
-        
-        # Color based on circle index
-        color = cmap(i / NUM_CIRCLES)
-        
-        # Plot
-        ax.plot(x, y, color=color, linewidth=LINE_WIDTH, alpha=ALPHA)
+    # Parametric angle, frequencies and per-circle radii
+    theta = np.linspace(0, 2 * np.pi, POINTS_PER_CIRCLE)
+    freqs = np.arange(1, NOISE_FREQUENCY)
+    radius = 0.1 + np.arange(NUM_CIRCLES) * 0.09
+    
+    # Add multiple noise frequencies, all circles at once
+    # Shapes: (circles, frequencies, points) summed over frequencies
+    phases = np.random.rand(NUM_CIRCLES, len(freqs)) * 2 * np.pi
+    amplitudes = NOISE_AMPLITUDE / freqs
+    noise = (amplitudes[None, :, None] *
+             np.sin(freqs[None, :, None] * theta[None, None, :] +
+                    phases[:, :, None])).sum(axis=1)
+    
+    # Apply noise to radius
+    r = radius[:, None] * (1 + noise)
+    
+    # Convert to Cartesian, one (points, 2) polyline per circle
+    polylines = np.stack([r * np.cos(theta), r * np.sin(theta)], axis=-1)
+    
+    # Draw all circles as one collection, colored by circle index
+    colors = cmap(np.arange(NUM_CIRCLES) / NUM_CIRCLES)
+    lc = LineCollection(polylines, colors=colors,
+                       linewidths=LINE_WIDTH, alpha=ALPHA)
+    ax.add_collection(lc)
     
     max_radius = 0.1 + NUM_CIRCLES * 0.09 + NOISE_AMPLITUDE
     ax.set_xlim(-max_radius, max_radius)
@@ -22,22 +22,18 @@ def generate_dragon_curve(iterations):
     
     print(f"Generating dragon curve (iteration {iterations})...")
     
-    # Start with simple sequence
-    sequence = 'FX'
+    # Start with simple sequence (as bytes, one byte per command)
+    sequence = b'FX'
     
-    # L-system rules:
+    # L-system rules as a lookup table indexed by byte value:
     # X -> X+YF+
     # Y -> -FX-Y
+    rules = [bytes([c]) for c in range(256)]
+    rules[ord('X')] = b'X+YF+'
+    rules[ord('Y')] = b'-FX-Y'
+    
     for i in range(iterations):
-        new_sequence = ''
-        for char in sequence:
-            if char == 'X':
-                new_sequence += 'X+YF+'
-            elif char == 'Y':
-                new_sequence += '-FX-Y'
-            else:
-                new_sequence += char
-        sequence = new_sequence
+        sequence = b''.join(map(rules.__getitem__, sequence))
         print(f"  Iteration {i+1}/{iterations} - Length: {len(sequence)}")
     
     return sequence
@@ -47,29 +43,31 @@ def draw_dragon_curve(sequence):
     
     print("Converting to coordinates...")
     
-    x, y = 0, 0
-    angle = 0
-    step = 1
-    
-    points = [(x, y)]
-    
-    for i, char in enumerate(sequence):
-        if char == 'F':
-            # Move forward
-            x += step * np.cos(np.radians(angle))
-            y += step * np.sin(np.radians(angle))
-            points.append((x, y))
-        elif char == '+':
-            # Turn right 90 degrees
-            angle -= 90
-        elif char == '-':
-            # Turn left 90 degrees
-            angle += 90
-        
-        if (i + 1) % 10000 == 0:
-            print(f"  Processed {i+1}/{len(sequence)} commands")
-    
-    return np.array(points)
+    commands = np.frombuffer(sequence, dtype=np.uint8)
+    forward, right, left = b'F+-'
+    
+    # Turn right (-90 degrees) on '+', left (+90 degrees) on '-'
+    turns = np.zeros(len(commands), dtype=np.int64)
+    turns[commands == right] = -1
+    turns[commands == left] = 1
+    
+    # Heading before each command, as a quarter-turn index 0..3
+    heading = np.cumsum(turns) & 3
+    
+    # Unit steps for each heading lie on the integer lattice, so no trig
+    step_x = np.array([1, 0, -1, 0], dtype=np.int32)
+    step_y = np.array([0, 1, 0, -1], dtype=np.int32)
+    
+    # Move forward only on 'F' commands
+    is_forward = commands == forward
+    dx = step_x[heading[is_forward]]
+    dy = step_y[heading[is_forward]]
+    
+    points = np.zeros((len(dx) + 1, 2), dtype=np.int32)
+    np.cumsum(dx, out=points[1:, 0])
+    np.cumsum(dy, out=points[1:, 1])
+    
+    return points
 
 def create_dragon_curve():
     """Create dragon curve visualization"""
@@ -5,6 +5,7 @@ Creates organic flowing curves using Perlin-like noise and Bezier paths
 
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 from scipy.interpolate import CubicSpline
 import matplotlib.colors as mcolors
 
@@ -20,17 +21,16 @@ ALPHA = 0.4
 DPI = 150
 OUTPUT_FILE = 'flowing_curves.jpg'
 
-def generate_smooth_noise(length, scale=1.0):
-    """Generate smooth random variations"""
+def generate_smooth_noise(num_curves, length, scale=1.0):
+    """Generate smooth random variations, one row per curve"""
     x = np.linspace(0, scale * 4 * np.pi, length)
-    noise = np.zeros(length)
     
-    # Multiple frequency components
-    for freq in [1, 2, 4]:
-        phase = np.random.rand() * 2 * np.pi
-        noise += np.sin(freq * x + phase) / freq
+    # Multiple frequency components, shape (curves, frequencies, points)
+    freqs = np.array([1, 2, 4])
+    phases = np.random.rand(num_curves, len(freqs)) * 2 * np.pi
+    waves = np.sin(freqs[None, :, None] * x[None, None, :] + phases[:, :, None])
     
-    return noise
+    return (waves / freqs[None, :, None]).sum(axis=1)
 
 def create_flowing_curves():
     """Create organic flowing curve patterns"""
@@ -42,29 +42,28 @@ def create_flowing_curves():
     # Get colormap
     cmap = plt.get_cmap(COLORMAP)
     
-    # Generate curves
-    for i in range(NUM_CURVES):
-        # Base y position
-        y_base = i * 0.15 - NUM_CURVES * 0.075
-        
-        # X coordinates
-        x = np.linspace(-8, 8, POINTS_PER_CURVE)
-        
-        # Generate smooth noise for y variation
-        noise = generate_smooth_noise(POINTS_PER_CURVE, NOISE_SCALE)
-        
-        # Add wave patterns
-        wave = AMPLITUDE * np.sin(x * 0.5 + i * 0.3)
-        
-        # Combine for y coordinates
-        y = y_base + noise * 0.3 + wave * 0.2
-        
-        # Color based on position
-        color = cmap(i / NUM_CURVES)
-        
-        # Plot curve
-        ax.plot(x, y, color=color, linewidth=LINE_WIDTH, 
-               alpha=ALPHA, solid_capstyle='round')
+    # X coordinates, shared by all curves
+    x = np.linspace(-8, 8, POINTS_PER_CURVE)
+    
+    # Base y position and curve index, one row per curve
+    i = np.arange(NUM_CURVES)[:, None]
+    y_base = i * 0.15 - NUM_CURVES * 0.075
+    
+    # Generate smooth noise for y variation
+    noise = generate_smooth_noise(NUM_CURVES, POINTS_PER_CURVE, NOISE_SCALE)
+    
+    # Add wave patterns
+    wave = AMPLITUDE * np.sin(x[None, :] * 0.5 + i * 0.3)
+    
+    # Combine for y coordinates
+    Y = y_base + noise * 0.3 + wave * 0.2
+    
+    # Plot all curves as one collection, colored by position
+    polylines = [np.column_stack([x, y]) for y in Y]
+    colors = cmap(np.arange(NUM_CURVES) / NUM_CURVES)
+    lc = LineCollection(polylines, colors=colors, linewidths=LINE_WIDTH,
+                       alpha=ALPHA, capstyle='round')
+    ax.add_collection(lc)
     
     # Styling
     ax.set_xlim(-8, 8)
@@ -5,7 +5,7 @@ Visualizes Fourier series as rotating circles (epicycles)
 
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.collections import LineCollection
+from matplotlib.collections import LineCollection, EllipseCollection
 
 # Parameters
 SHAPE_TYPE = 'heart'  # 'heart', 'star', 'spiral', 'square'
@@ -45,11 +45,10 @@ def get_shape_points(shape_type, num_points=200):
 def compute_fourier_series(points, n_terms):
     """Compute Fourier coefficients"""
     N = len(points)
-    coeffs = []
+    F = np.fft.fft(points) / N
     
-    for k in range(-n_terms//2, n_terms//2 + 1):
-        c = np.sum(points * np.exp(-2j * np.pi * k * np.arange(N) / N)) / N
-        coeffs.append((k, c))
+    # Negative frequencies live at the end of the FFT output
+    coeffs = [(k, F[k % N]) for k in range(-n_terms//2, n_terms//2 + 1)]
     
     # Sort by magnitude
     coeffs.sort(key=lambda x: abs(x[1]), reverse=True)
@@ -75,21 +74,13 @@ def create_fourier_epicycles():
     
     cmap = plt.get_cmap(COLORMAP)
     
-    # Draw path traced by epicycles
-    path = []
-    
-    for step in range(DRAWING_STEPS):
-        t = 2 * np.pi * step / DRAWING_STEPS
-        
-        # Calculate position from epicycles
-        pos = 0 + 0j
-        for k, c in coeffs:
-            pos += c * np.exp(2j * np.pi * k * t)
-        
-        path.append(pos)
+    # Draw path traced by epicycles: one matrix multiply over all steps
+    ks = np.array([k for k, _ in coeffs])
+    cs = np.array([c for _, c in coeffs])
+    t = 2 * np.pi * np.arange(DRAWING_STEPS) / DRAWING_STEPS
+    path = np.exp(2j * np.pi * np.outer(t, ks)) @ cs
     
     # Draw the traced path
-    path = np.array(path)
     x_path = path.real
     y_path = path.imag
     
@@ -106,25 +97,27 @@ def create_fourier_epicycles():
     # Optionally draw epicycles at final position
     if SHOW_CIRCLES:
         t = 0  # Start position
-        pos = 0 + 0j
         
-        for i, (k, c) in enumerate(coeffs):
-            prev_pos = pos
-            radius = abs(c)
-            angle = np.angle(c) + 2 * np.pi * k * t
-            pos += c * np.exp(2j * np.pi * k * t)
-            
-            # Draw circle
-            circle = plt.Circle((prev_pos.real, prev_pos.imag), radius,
-                              fill=False, edgecolor=cmap(i/len(coeffs)),
-                              linewidth=CIRCLE_WIDTH, alpha=0.3)
-            ax.add_patch(circle)
-            
-            # Draw radius line
-            ax.plot([prev_pos.real, pos.real], 
-                   [prev_pos.imag, pos.imag],
-                   color=cmap(i/len(coeffs)), linewidth=CIRCLE_WIDTH,
-                   alpha=0.5)
+        # Each epicycle is centered on the tip of the previous one
+        tips = np.cumsum(cs * np.exp(2j * np.pi * ks * t))
+        centers = np.concatenate([[0], tips[:-1]])
+        diameters = 2 * np.abs(cs)
+        colors = cmap(np.arange(len(coeffs)) / len(coeffs))
+        
+        # Draw circles
+        circles = EllipseCollection(diameters, diameters, 0, units='xy',
+                                    offsets=np.column_stack([centers.real, centers.imag]),
+                                    offset_transform=ax.transData,
+                                    facecolors='none', edgecolors=colors,
+                                    linewidths=CIRCLE_WIDTH, alpha=0.3)
+        ax.add_collection(circles)
+        
+        # Draw radius lines
+        radii = np.stack([np.column_stack([centers.real, centers.imag]),
+                          np.column_stack([tips.real, tips.imag])], axis=1)
+        lines = LineCollection(radii, colors=colors,
+                               linewidths=CIRCLE_WIDTH, alpha=0.5)
+        ax.add_collection(lines)
     
     # Set limits
     margin = 1.2
@@ -5,12 +5,14 @@ Creates an explosive pattern of geometric shapes radiating from center
 
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.patches import Polygon, Circle
+from matplotlib.patches import Circle
+from matplotlib.collections import PolyCollection
 import matplotlib.colors as mcolors
 
 # Parameters
 NUM_SHAPES = 200
 SHAPE_TYPES = ['triangle', 'square', 'pentagon', 'hexagon']
+SHAPE_SIDES = {'triangle': 3, 'square': 4, 'pentagon': 5, 'hexagon': 6}
 EXPLOSION_RADIUS = 10
 ROTATION_CHAOS = True
 COLORMAP = 'rainbow'
@@ -22,12 +24,13 @@ EDGE_ALPHA = 0.2
 DPI = 150
 OUTPUT_FILE = 'geometric_explosion.jpg'
 
-def create_polygon(n_sides, center, radius, rotation=0):
-    """Create regular polygon vertices"""
-    angles = np.linspace(0, 2 * np.pi, n_sides, endpoint=False) + rotation
-    x = center[0] + radius * np.cos(angles)
-    y = center[1] + radius * np.sin(angles)
-    return np.column_stack([x, y])
+def create_polygons(n_sides, centers_x, centers_y, radii, rotations):
+    """Create vertices for many regular polygons with the same side count"""
+    base = np.linspace(0, 2 * np.pi, n_sides, endpoint=False)
+    angles = base[None, :] + rotations[:, None]
+    x = centers_x[:, None] + radii[:, None] * np.cos(angles)
+    y = centers_y[:, None] + radii[:, None] * np.sin(angles)
+    return np.stack([x, y], axis=-1)
 
 def create_geometric_explosion():
     """Create explosive geometric pattern"""
@@ -40,47 +43,45 @@ def create_geometric_explosion():
     
     cmap = plt.get_cmap(COLORMAP)
     
-    # Generate shapes radiating outward
-    for i in range(NUM_SHAPES):
-        # Random angle and distance from center
-        angle = np.random.rand() * 2 * np.pi
-        distance = np.random.rand() ** 0.5 * EXPLOSION_RADIUS
-        
-        # Position
-        x = distance * np.cos(angle)
-        y = distance * np.sin(angle)
-        
-        # Shape size decreases with distance
-        size = 0.8 * (1 - distance / EXPLOSION_RADIUS) + 0.2
-        
-        # Random shape type
-        shape_type = np.random.choice(SHAPE_TYPES)
-        
-        # Rotation
-        if ROTATION_CHAOS:
-            rotation = np.random.rand() * 2 * np.pi
-        else:
-            rotation = angle  # Align with explosion direction
-        
-        # Color based on distance and angle
-        color_val = (distance / EXPLOSION_RADIUS + angle / (2 * np.pi)) / 2
-        color = cmap(color_val)
-        
-        # Create shape
-        if shape_type == 'triangle':
-            vertices = create_polygon(3, (x, y), size, rotation)
-        elif shape_type == 'square':
-            vertices = create_polygon(4, (x, y), size, rotation)
-        elif shape_type == 'pentagon':
-            vertices = create_polygon(5, (x, y), size, rotation)
-        elif shape_type == 'hexagon':
-            vertices = create_polygon(6, (x, y), size, rotation)
-        
-        # Add polygon
-        poly = Polygon(vertices, facecolor=color, 
-                      edgecolor=EDGE_COLOR, linewidth=EDGE_WIDTH,
-                      alpha=ALPHA)
-        ax.add_patch(poly)
+    # Random angle and distance from center, drawn for all shapes at once
+    angles = np.random.rand(NUM_SHAPES) * 2 * np.pi
+    distances = np.random.rand(NUM_SHAPES) ** 0.5 * EXPLOSION_RADIUS
+    
+    # Position
+    xs = distances * np.cos(angles)
+    ys = distances * np.sin(angles)
+    
+    # Shape size decreases with distance
+    sizes = 0.8 * (1 - distances / EXPLOSION_RADIUS) + 0.2
+    
+    # Random shape type, as a side count
+    shape_sides = np.array([SHAPE_SIDES[t] for t in SHAPE_TYPES])
+    sides = shape_sides[np.random.randint(len(SHAPE_TYPES), size=NUM_SHAPES)]
+    
+    # Rotation
+    if ROTATION_CHAOS:
+        rotations = np.random.rand(NUM_SHAPES) * 2 * np.pi
+    else:
+        rotations = angles  # Align with explosion direction
+    
+    # Color based on distance and angle
+    color_vals = (distances / EXPLOSION_RADIUS + angles / (2 * np.pi)) / 2
+    facecolors = cmap(color_vals)
+    
+    # Create vertices in one batch per side count, keeping draw order
+    polygons = [None] * NUM_SHAPES
+    for n_sides in np.unique(sides):
+        idx = np.flatnonzero(sides == n_sides)
+        vertices = create_polygons(n_sides, xs[idx], ys[idx],
+                                   sizes[idx], rotations[idx])
+        for i, verts in zip(idx, vertices):
+            polygons[i] = verts
+    
+    # Add all polygons as a single collection
+    pc = PolyCollection(polygons, facecolors=facecolors,
+                       edgecolors=EDGE_COLOR, linewidths=EDGE_WIDTH,
+                       alpha=ALPHA)
+    ax.add_collection(pc)
     
     # Add central burst circle
     central_circle = Circle((0, 0), 0.5, 
@@ -3,9 +3,17 @@ Julia Set - Algorithmic Art
 Creates beautiful Julia set fractals with various parameters
 """
 
+import math
 import numpy as np
 import matplotlib.pyplot as plt
 
+# Numba is optional; fall back to pure NumPy when it isn't installed
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 # Parameters
 WIDTH = 1200
 HEIGHT = 1200
@@ -22,6 +30,31 @@ COLORMAP = 'twilight'
 BACKGROUND = '#000000'
 DPI = 150
 OUTPUT_FILE = 'julia_set.jpg'
+SHOW_PLOT = True  # False saves the raster directly, skipping the figure
+
+if HAS_NUMBA:
+    @njit(parallel=True, cache=True)
+    def julia_kernel(out, width, height, x_min, x_max, y_min, y_max,
+                     c_real, c_imag, max_iter):
+        """Per-pixel escape-time kernel with smooth coloring"""
+        dx = (x_max - x_min) / (width - 1)
+        dy = (y_max - y_min) / (height - 1)
+        log2 = math.log(2.0)
+        
+        for j in prange(height):
+            for i in range(width):
+                zr = x_min + i * dx
+                zi = y_min + j * dy
+                
+                # Iterate until escape, keeping z in registers
+                n = 0
+                while n < max_iter and zr*zr + zi*zi <= 4.0:
+                    zr, zi = zr*zr - zi*zi + c_real, 2*zr*zi + c_imag
+                    n += 1
+                
+                # Last iteration at which the point was still bounded
+                m = max(n - 1, 0)
+                out[j, i] = m + 1 - math.log(math.log(math.sqrt(zr*zr + zi*zi) + 1)) / log2
 
 def calculate_julia_set(width, height, x_min, x_max, y_min, y_max, 
                        c_real, c_imag, max_iter):
@@ -29,31 +62,52 @@ def calculate_julia_set(width, height, x_min, x_max, y_min, y_max,
     
     print(f"Calculating Julia set with c = {c_real} + {c_imag}i...")
     
-    # Create coordinate arrays
-    x = np.linspace(x_min, x_max, width)
-    y = np.linspace(y_min, y_max, height)
+    if HAS_NUMBA:
+        M = np.empty((height, width), dtype=np.float32)
+        julia_kernel(M, width, height, x_min, x_max, y_min, y_max,
+                     c_real, c_imag, max_iter)
+        return np.nan_to_num(M)
+    
+    # Create coordinate arrays (float32 halves memory traffic)
+    x = np.linspace(x_min, x_max, width, dtype=np.float32)
+    y = np.linspace(y_min, y_max, height, dtype=np.float32)
     X, Y = np.meshgrid(x, y)
+    c_real = np.float32(c_real)
+    c_imag = np.float32(c_imag)
     
-    # Complex plane
-    Z = X + 1j * Y
-    C = c_real + 1j * c_imag
+    # Packed real/imag parts of only the points still iterating
+    zr = X.ravel().copy()
+    zi = Y.ravel().copy()
+    active = np.arange(zr.size)
     
-    # Initialize arrays
-    M = np.zeros(Z.shape)
+    # Final z value and iteration count for every point
+    Zr = np.empty_like(zr)
+    Zi = np.empty_like(zi)
+    M = np.zeros(zr.size, dtype=np.float32)
     
     # Julia set iteration
     for i in range(max_iter):
-        # Points that haven't escaped
-        mask = np.abs(Z) <= 2
+        # Drop points that have escaped, keeping their final z
+        escaped = zr*zr + zi*zi > 4
+        if escaped.any():
+            Zr[active[escaped]] = zr[escaped]
+            Zi[active[escaped]] = zi[escaped]
+            keep = ~escaped
+            zr, zi, active = zr[keep], zi[keep], active[keep]
+            if active.size == 0:
+                break
         
-        # Update Z for points that haven't escaped
-        Z[mask] = Z[mask]**2 + C
-        
-        # Record iteration count at escape
-        M[mask] = i
+        # Record iteration count and update the remaining points
+        M[active] = i
+        zr, zi = zr*zr - zi*zi + c_real, 2*zr*zi + c_imag
+    
+    Zr[active] = zr
+    Zi[active] = zi
+    M = M.reshape(X.shape)
+    Z_abs = np.sqrt(Zr*Zr + Zi*Zi).reshape(X.shape)
     
     # Smooth coloring using escape time
-    M = M + 1 - np.log(np.log(np.abs(Z) + 1)) / np.log(2)
+    M = M + 1 - np.log(np.log(Z_abs + 1)) / np.float32(np.log(2))
     M = np.nan_to_num(M)
     
     return M
@@ -67,13 +121,23 @@ def create_julia_set():
     
     print("Creating visualization...")
     
+    # Logarithmic scaling for better colors
+    image = np.log(M + 1)
+    
+    if not SHOW_PLOT:
+        # Colormap the array and write one pixel per point, no Agg render
+        plt.imsave(OUTPUT_FILE, image, cmap=COLORMAP, origin='lower',
+                   pil_kwargs={'quality': 95})
+        print(f"Saved: {OUTPUT_FILE}")
+        return
+    
     # Create figure
     fig, ax = plt.subplots(figsize=(12, 12), dpi=DPI)
     fig.patch.set_facecolor(BACKGROUND)
     ax.set_facecolor(BACKGROUND)
     
     # Display with logarithmic scaling for better colors
-    im = ax.imshow(np.log(M + 1), cmap=COLORMAP, 
+    im = ax.imshow(image, cmap=COLORMAP, 
                    extent=[X_MIN, X_MAX, Y_MIN, Y_MAX],
                    interpolation='bilinear', origin='lower')
     
@@ -31,32 +31,27 @@ def create_lissajous_web():
     
     cmap = plt.get_cmap(COLORMAP)
     
-    # Generate multiple Lissajous curves
-    for i in range(NUM_CURVES):
-        # Random frequency ratios
-        freq_x = np.random.uniform(*FREQUENCY_RANGE)
-        freq_y = np.random.uniform(*FREQUENCY_RANGE)
-        
-        # Random phase shifts
-        phase_x = np.random.uniform(*PHASE_RANGE)
-        phase_y = np.random.uniform(*PHASE_RANGE)
-        
-        # Generate parametric curve
-        t = np.linspace(0, 2 * np.pi, POINTS_PER_CURVE)
-        x = AMPLITUDE * np.sin(freq_x * t + phase_x)
-        y = AMPLITUDE * np.sin(freq_y * t + phase_y)
-        
-        # Create segments for gradient coloring
-        points = np.array([x, y]).T.reshape(-1, 1, 2)
-        segments = np.concatenate([points[:-1], points[1:]], axis=1)
-        
-        # Color gradient along curve
-        colors = np.linspace(0, 1, len(segments))
-        
-        lc = LineCollection(segments, cmap=cmap, 
-                           linewidth=LINE_WIDTH, alpha=ALPHA)
-        lc.set_array(colors)
-        ax.add_collection(lc)
+    # Random frequency ratios and phase shifts, one row per curve
+    freq_x, freq_y = np.random.uniform(*FREQUENCY_RANGE, size=(2, NUM_CURVES))
+    phase_x, phase_y = np.random.uniform(*PHASE_RANGE, size=(2, NUM_CURVES))
+    
+    # Generate all parametric curves at once, shape (curves, points)
+    t = np.linspace(0, 2 * np.pi, POINTS_PER_CURVE)
+    x = AMPLITUDE * np.sin(freq_x[:, None] * t + phase_x[:, None])
+    y = AMPLITUDE * np.sin(freq_y[:, None] * t + phase_y[:, None])
+    
+    # Create segments for gradient coloring, shape (curves, points-1, 2, 2)
+    points = np.stack([x, y], axis=-1)
+    segments = np.stack([points[:, :-1], points[:, 1:]], axis=2)
+    segments = segments.reshape(-1, 2, 2)
+    
+    # Color gradient along each curve
+    colors = np.tile(np.linspace(0, 1, POINTS_PER_CURVE - 1), NUM_CURVES)
+    
+    lc = LineCollection(segments, cmap=cmap, 
+                       linewidth=LINE_WIDTH, alpha=ALPHA)
+    lc.set_array(colors)
+    ax.add_collection(lc)
     
     ax.set_xlim(-AMPLITUDE, AMPLITUDE)
     ax.set_ylim(-AMPLITUDE, AMPLITUDE)
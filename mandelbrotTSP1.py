@@ -7,8 +7,23 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.collections import LineCollection
 from scipy.spatial.distance import cdist
+import math
 import time
 
+# Numba is optional; fall back to pure NumPy when it isn't installed
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# CUDA is optional too; large 2-opt runs use the GPU when one is present
+try:
+    from numba import cuda
+    HAS_CUDA = cuda.is_available()
+except ImportError:
+    HAS_CUDA = False
+
 # ============================================================================
 # PARAMETERS - Adjust these to change the output
 # ============================================================================
@@ -28,6 +43,8 @@ SAMPLE_METHOD = 'boundary'       # 'boundary', 'gradient', or 'random'
 # TSP Parameters
 TSP_METHOD = 'nearest_neighbor'              # 'nearest_neighbor' or '2opt'
 TWO_OPT_ITERATIONS = 50          # Number of 2-opt improvements (if using 2opt)
+GPU_MIN_POINTS = 5000            # Use the CUDA 2-opt from this many points up
+MAX_GPU_MOVES = 65535            # Most 2-opt moves applied per GPU pass (grid rows)
 
 # Visual Parameters
 LINE_WIDTH = 0.7                 # Width of the drawn line
@@ -50,17 +67,17 @@ def calculate_mandelbrot(width, height, x_min, x_max, y_min, y_max, max_iter):
     """
     print("Calculating Mandelbrot set...")
     
-    # Create coordinate arrays
-    x = np.linspace(x_min, x_max, width)
-    y = np.linspace(y_min, y_max, height)
+    # Create coordinate arrays (single precision halves memory traffic)
+    x = np.linspace(x_min, x_max, width, dtype=np.float32)
+    y = np.linspace(y_min, y_max, height, dtype=np.float32)
     X, Y = np.meshgrid(x, y)
     
     # Complex plane
-    C = X + 1j * Y
+    C = (X + 1j * Y).astype(np.complex64)
     
     # Initialize arrays
     Z = np.zeros_like(C)
-    M = np.zeros(C.shape)
+    M = np.zeros(C.shape, dtype=np.float32)
     
     # Mandelbrot iteration
     for i in range(max_iter):
@@ -116,8 +133,8 @@ def extract_points(M, X, Y, num_points, method='boundary', threshold=2.0):
         grad_y, grad_x = np.gradient(M)
         gradient_magnitude = np.sqrt(grad_x**2 + grad_y**2)
         
-        # Normalize to probability
-        prob = gradient_magnitude.flatten()
+        # Normalize to probability (in double, so it sums to 1 within tolerance)
+        prob = gradient_magnitude.flatten().astype(np.float64)
         prob = prob / prob.sum()
         
         # Sample indices
@@ -129,8 +146,9 @@ def extract_points(M, X, Y, num_points, method='boundary', threshold=2.0):
         points_y = np.random.randint(0, M.shape[0], num_points)
         points_x = np.random.randint(0, M.shape[1], num_points)
     
-    # Get actual coordinates
-    points = np.column_stack([X[points_y, points_x], Y[points_y, points_x]])
+    # Get actual coordinates, in double precision for the TSP distance sums
+    points = np.column_stack([X[points_y, points_x],
+                              Y[points_y, points_x]]).astype(np.float64)
     iterations = M[points_y, points_x]
     
     print(f"Extracted {len(points)} points")
@@ -147,31 +165,248 @@ def nearest_neighbor_tsp(points):
     """
     print("Solving TSP with nearest neighbor method...")
     n = len(points)
-    unvisited = set(range(n))
-    path = [0]  # Start at first point
-    unvisited.remove(0)
     
-    current = 0
-    while unvisited:
+    # Pairwise distances, computed once
+    D = cdist(points, points)
+    
+    visited = np.zeros(n, dtype=bool)
+    path = np.empty(n, dtype=np.int64)
+    path[0] = 0  # Start at first point
+    visited[0] = True
+    
+    for k in range(1, n):
         # Find nearest unvisited point
-        distances = cdist([points[current]], points[list(unvisited)])[0]
-        nearest_idx = np.argmin(distances)
-        nearest = list(unvisited)[nearest_idx]
+        distances = D[path[k-1]].copy()
+        distances[visited] = np.inf
+        nearest = np.argmin(distances)
         
-        path.append(nearest)
-        unvisited.remove(nearest)
-        current = nearest
+        path[k] = nearest
+        visited[nearest] = True
     
     return path
 
+if HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _dist(points, a, b):
+        """Euclidean distance between points a and b"""
+        dx = points[a, 0] - points[b, 0]
+        dy = points[a, 1] - points[b, 1]
+        return math.sqrt(dx*dx + dy*dy)
+    
+    @njit(cache=True, fastmath=True)
+    def two_opt_kernel(points, path, iterations):
+        """
+        First-improvement 2-opt with don't-look bits, modifying path in place.
+        Returns the number of passes made.
+        """
+        n = len(path)
+        
+        # Points whose incident edges have not changed since they last
+        # failed to yield an improving move are skipped
+        dont_look = np.zeros(len(points), dtype=np.uint8)
+        
+        iter_count = 0
+        
+        while iter_count < iterations:
+            improved = False
+            iter_count += 1
+            full_pass = not dont_look.any()
+            
+            for i in range(1, n - 1):
+                if dont_look[path[i]]:
+                    continue
+                
+                found = False
+                for j in range(i + 1, n):
+                    a, b = path[i-1], path[i]
+                    c, d = path[j], path[(j + 1) % n]
+                    
+                    delta = (_dist(points, a, c) + _dist(points, b, d) -
+                             _dist(points, a, b) - _dist(points, c, d))
+                    
+                    if delta < -1e-12:
+                        # Reverse path[i:j+1] in place
+                        lo, hi = i, j
+                        while lo < hi:
+                            path[lo], path[hi] = path[hi], path[lo]
+                            lo += 1
+                            hi -= 1
+                        
+                        dont_look[a] = 0
+                        dont_look[b] = 0
+                        dont_look[c] = 0
+                        dont_look[d] = 0
+                        improved = True
+                        found = True
+                
+                if not found:
+                    dont_look[path[i]] = 1
+            
+            if not improved:
+                # Stop once a pass over every point finds nothing,
+                # otherwise recheck the skipped points
+                if full_pass:
+                    break
+                dont_look[:] = 0
+        
+        return iter_count
+
+if HAS_CUDA:
+    @cuda.jit(device=True)
+    def _dist_gpu(points, a, b):
+        """Euclidean distance between points a and b"""
+        dx = points[a, 0] - points[b, 0]
+        dy = points[a, 1] - points[b, 1]
+        return math.sqrt(dx*dx + dy*dy)
+    
+    @cuda.jit
+    def two_opt_best_kernel(points, path, best_delta, best_j):
+        """Best improving 2-opt move for each first edge i, one thread per i"""
+        i = cuda.grid(1)
+        n = path.shape[0]
+        if i >= n:
+            return
+        
+        best = -1e-12
+        bj = -1
+        if 1 <= i < n - 1:
+            a, b = path[i-1], path[i]
+            d_ab = _dist_gpu(points, a, b)
+            for j in range(i + 1, n):
+                c, d = path[j], path[(j + 1) % n]
+                delta = (_dist_gpu(points, a, c) + _dist_gpu(points, b, d) -
+                         d_ab - _dist_gpu(points, c, d))
+                if delta < best:
+                    best = delta
+                    bj = j
+        
+        best_delta[i] = best
+        best_j[i] = bj
+    
+    @cuda.jit
+    def reverse_segments_kernel(path, starts, ends):
+        """Reverse path[starts[m]:ends[m]+1] for every move m in place"""
+        k, m = cuda.grid(2)
+        lo = starts[m] + k
+        hi = ends[m] - k
+        if lo < hi:
+            tmp = path[lo]
+            path[lo] = path[hi]
+            path[hi] = tmp
+
+def two_opt_gpu(points, path, iterations):
+    """
+    2-opt on the GPU, modifying path in place.
+    Each pass finds the best move for every i, then applies a batch of
+    non-overlapping improving moves on the device.
+    Returns the number of passes made.
+    """
+    n = len(path)
+    threads = 128
+    blocks = (n + threads - 1) // threads
+    
+    # Points and path stay on the device; only the per-i results and the
+    # chosen moves cross the bus each pass, through pinned host buffers
+    stream = cuda.stream()
+    d_points = cuda.to_device(points, stream=stream)
+    d_path = cuda.to_device(path, stream=stream)
+    d_best_delta = cuda.device_array(n, dtype=np.float64, stream=stream)
+    d_best_j = cuda.device_array(n, dtype=np.int64, stream=stream)
+    d_starts = cuda.device_array(n, dtype=np.int64, stream=stream)
+    d_ends = cuda.device_array(n, dtype=np.int64, stream=stream)
+    best_delta = cuda.pinned_array(n, dtype=np.float64)
+    best_j = cuda.pinned_array(n, dtype=np.int64)
+    starts = cuda.pinned_array(n, dtype=np.int64)
+    ends = cuda.pinned_array(n, dtype=np.int64)
+    
+    iter_count = 0
+    while iter_count < iterations:
+        iter_count += 1
+        two_opt_best_kernel[blocks, threads, stream](d_points, d_path,
+                                                     d_best_delta, d_best_j)
+        d_best_delta.copy_to_host(best_delta, stream=stream)
+        d_best_j.copy_to_host(best_j, stream=stream)
+        stream.synchronize()
+        
+        # Take the best moves first, skipping any that touch a position
+        # already read or reversed so every delta stays valid
+        taken = np.zeros(n + 1, dtype=bool)
+        count = 0
+        for i in np.argsort(best_delta):
+            j = best_j[i]
+            if j < 0 or count == MAX_GPU_MOVES:
+                break
+            if taken[i-1:j+2].any():
+                continue
+            taken[i-1:j+2] = True
+            starts[count] = i
+            ends[count] = j
+            count += 1
+        
+        if count == 0:
+            break
+        
+        # One thread per swap, one grid row per move
+        d_starts[:count].copy_to_device(starts[:count], stream=stream)
+        d_ends[:count].copy_to_device(ends[:count], stream=stream)
+        swaps = (ends[:count] - starts[:count]).max() // 2 + 1
+        grid = ((swaps + threads - 1) // threads, count)
+        reverse_segments_kernel[grid, (threads, 1), stream](
+            d_path, d_starts[:count], d_ends[:count])
+    
+    d_path.copy_to_host(path, stream=stream)
+    stream.synchronize()
+    return iter_count
+
+def load_two_opt_c():
+    """
+    Compile and import the Cython 2-opt kernel in tsp_ext.pyx.
+    Returns None when Cython or a C compiler is unavailable.
+    """
+    try:
+        import pyximport
+        importers = pyximport.install(language_level=3)
+        try:
+            from tsp_ext import two_opt_c
+        finally:
+            # Don't leave the import hook installed for the rest of the process
+            pyximport.uninstall(*importers)
+    except ImportError:
+        return None
+    return two_opt_c
+
 def two_opt(points, initial_path, iterations=100):
     """
     Improve TSP solution using 2-opt local search.
+    Uses the CUDA kernel for large inputs and the Numba or Cython kernel
+    when available, otherwise for each i all candidate j are evaluated at
+    once with NumPy.
     """
     print(f"Optimizing with 2-opt ({iterations} iterations)...")
-    path = initial_path.copy()
+    path = np.array(initial_path, dtype=np.int64)
     n = len(path)
     
+    if HAS_CUDA and n >= GPU_MIN_POINTS:
+        iter_count = two_opt_gpu(points, path, iterations)
+        print(f"2-opt completed after {iter_count} iterations on the GPU")
+        return path
+    
+    if HAS_NUMBA:
+        iter_count = two_opt_kernel(points, path, iterations)
+        print(f"2-opt completed after {iter_count} iterations")
+        return path
+    
+    # Without numba, try the compiled Cython kernel instead
+    two_opt_c = load_two_opt_c()
+    if two_opt_c is not None:
+        iter_count = two_opt_c(np.ascontiguousarray(points, dtype=np.float64),
+                               path, iterations)
+        print(f"2-opt completed after {iter_count} iterations")
+        return path
+    
+    # Pairwise distances, indexed by point id
+    D = cdist(points, points)
+    
     improved = True
     iter_count = 0
     
@@ -180,23 +415,20 @@ def two_opt(points, initial_path, iterations=100):
         iter_count += 1
         
         for i in range(1, n - 1):
-            for j in range(i + 1, n):
-                # Calculate current distance
-                current_dist = (
-                    np.linalg.norm(points[path[i-1]] - points[path[i]]) +
-                    np.linalg.norm(points[path[j]] - points[path[(j+1) % n]])
-                )
-                
-                # Calculate distance after swap
-                new_dist = (
-                    np.linalg.norm(points[path[i-1]] - points[path[j]]) +
-                    np.linalg.norm(points[path[i]] - points[path[(j+1) % n]])
-                )
-                
-                if new_dist < current_dist:
-                    # Reverse the segment
-                    path[i:j+1] = path[i:j+1][::-1]
-                    improved = True
+            # Candidate second edges (path[j], path[j+1]) for all j > i
+            j = np.arange(i + 1, n)
+            a, b = path[i-1], path[i]
+            c, d = path[j], path[(j + 1) % n]
+            
+            # Change in length if the segment path[i:j+1] is reversed
+            delta = D[a, c] + D[b, d] - D[a, b] - D[c, d]
+            
+            best = np.argmin(delta)
+            if delta[best] < -1e-12:
+                # Reverse the segment
+                k = j[best]
+                path[i:k+1] = path[i:k+1][::-1]
+                improved = True
         
         if iter_count % 10 == 0:
             print(f"  2-opt iteration {iter_count}/{iterations}")
@@ -244,12 +476,8 @@ def create_gradient_line_plot(points, path, iterations, color_by='position',
     ordered_points = points[path]
     ordered_iterations = iterations[path]
     
-    # Create line segments
-    segments = []
-    for i in range(len(ordered_points) - 1):
-        segments.append([ordered_points[i], ordered_points[i + 1]])
-    
-    segments = np.array(segments)
+    # Create line segments, shape (n - 1, 2, 2)
+    segments = np.stack([ordered_points[:-1], ordered_points[1:]], axis=1)
     
     # Determine colors
     if color_by == 'position':
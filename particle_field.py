@@ -20,23 +20,22 @@ DPI = 150
 OUTPUT_FILE = 'particle_field.jpg'
 
 def force_field(x, y, t, complexity=3):
-    """Calculate force field at position (x, y) and time t"""
-    fx = 0
-    fy = 0
-    
-    # Multiple rotating force centers
-    for i in range(complexity):
-        angle = (i / complexity) * 2 * np.pi + t * 0.1
-        cx = 5 * np.cos(angle)
-        cy = 5 * np.sin(angle)
-        
-        dx = x - cx
-        dy = y - cy
-        dist = np.sqrt(dx**2 + dy**2) + 0.1
-        
-        # Vortex-like force
-        fx += -dy / dist**2
-        fy += dx / dist**2
+    """Calculate force field at positions (x, y) and time t"""
+    x = np.asarray(x)[..., None]
+    y = np.asarray(y)[..., None]
+    
+    # Multiple rotating force centers, broadcast against all positions
+    angle = (np.arange(complexity) / complexity) * 2 * np.pi + t * 0.1
+    cx = 5 * np.cos(angle)
+    cy = 5 * np.sin(angle)
+    
+    dx = x - cx
+    dy = y - cy
+    dist2 = (np.sqrt(dx**2 + dy**2) + 0.1)**2
+    
+    # Vortex-like force, summed over centers
+    fx = (-dy / dist2).sum(axis=-1)
+    fy = (dx / dist2).sum(axis=-1)
     
     return fx, fy
 
@@ -49,25 +48,27 @@ def create_particle_field():
     particles_x = np.random.uniform(-10, 10, NUM_PARTICLES)
     particles_y = np.random.uniform(-10, 10, NUM_PARTICLES)
     
-    # Store trajectories
-    trajectories = [[(particles_x[i], particles_y[i])] for i in range(NUM_PARTICLES)]
+    # Store trajectories, shape (steps + 1, particles, 2)
+    trajectories = np.empty((NUM_STEPS + 1, NUM_PARTICLES, 2))
+    trajectories[0, :, 0] = particles_x
+    trajectories[0, :, 1] = particles_y
     
-    # Simulate particle movement
+    # Simulate all particles together, one step at a time
     for step in range(NUM_STEPS):
-        for i in range(NUM_PARTICLES):
-            # Get force at current position
-            fx, fy = force_field(particles_x[i], particles_y[i], step, FIELD_COMPLEXITY)
-            
-            # Update position
-            particles_x[i] += fx * PARTICLE_SPEED
-            particles_y[i] += fy * PARTICLE_SPEED
-            
-            # Wrap around boundaries
-            particles_x[i] = np.clip(particles_x[i], -10, 10)
-            particles_y[i] = np.clip(particles_y[i], -10, 10)
-            
-            # Store position
-            trajectories[i].append((particles_x[i], particles_y[i]))
+        # Get force at current positions
+        fx, fy = force_field(particles_x, particles_y, step, FIELD_COMPLEXITY)
+        
+        # Update positions
+        particles_x += fx * PARTICLE_SPEED
+        particles_y += fy * PARTICLE_SPEED
+        
+        # Wrap around boundaries
+        np.clip(particles_x, -10, 10, out=particles_x)
+        np.clip(particles_y, -10, 10, out=particles_y)
+        
+        # Store positions
+        trajectories[step + 1, :, 0] = particles_x
+        trajectories[step + 1, :, 1] = particles_y
     
     print("Creating visualization...")
     
@@ -79,22 +80,17 @@ def create_particle_field():
     # Get colormap
     cmap = plt.get_cmap(COLORMAP)
     
-    # Plot trajectories
-    for i, trajectory in enumerate(trajectories):
-        points = np.array(trajectory)
-        
-        # Create line segments
-        segments = []
-        for j in range(len(points) - 1):
-            segments.append([points[j], points[j + 1]])
-        
-        # Color gradient along trajectory
-        colors = np.linspace(0, 1, len(segments))
-        
-        # Create line collection
-        lc = LineCollection(segments, colors=cmap(colors), 
-                           linewidths=LINE_WIDTH, alpha=ALPHA)
-        ax.add_collection(lc)
+    # Line segments for all trajectories, grouped by particle
+    paths = trajectories.transpose(1, 0, 2)
+    segments = np.stack([paths[:, :-1], paths[:, 1:]], axis=2).reshape(-1, 2, 2)
+    
+    # Color gradient along each trajectory, mapped once and shared by all
+    colors = np.tile(cmap(np.linspace(0, 1, NUM_STEPS)), (NUM_PARTICLES, 1))
+    
+    # Create line collection
+    lc = LineCollection(segments, colors=colors, 
+                       linewidths=LINE_WIDTH, alpha=ALPHA)
+    ax.add_collection(lc)
     
     # Styling
     ax.set_xlim(-10, 10)
@@ -7,6 +7,13 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.collections import LineCollection
 
+# Numba is optional; fall back to pure NumPy when it isn't installed
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 # Parameters
 GRID_SIZE = 50
 NUM_PARTICLES = 300
@@ -21,23 +28,30 @@ DPI = 150
 OUTPUT_FILE = 'perlin_noise_flow.jpg'
 
 def simple_noise(x, y, seed=42):
-    """Simple pseudo-noise function"""
-    np.random.seed(int((x * 12.9898 + y * 78.233) * 43758.5453) % 2**31)
-    return np.random.rand()
+    """Simple pseudo-noise from an integer hash of lattice coordinates"""
+    x = np.asarray(x).astype(np.uint32)
+    y = np.asarray(y).astype(np.uint32)
+    
+    # Integer hash with wrapping uint32 arithmetic
+    h = x * np.uint32(374761393) + y * np.uint32(668265263) + np.uint32(seed)
+    h = (h ^ (h >> np.uint32(13))) * np.uint32(1274126177)
+    h = h ^ (h >> np.uint32(16))
+    
+    return h * (1.0 / 2**32)
 
 def interpolate(a, b, t):
     """Smooth interpolation"""
     return a + (b - a) * (3 - 2 * t) * t * t
 
 def perlin_noise(x, y, scale=1.0):
-    """Simplified Perlin-like noise"""
-    x = x * scale
-    y = y * scale
+    """Simplified Perlin-like noise, evaluated elementwise on arrays"""
+    x = np.asarray(x) * scale
+    y = np.asarray(y) * scale
     
     # Grid coordinates
-    x0 = int(np.floor(x))
+    x0 = np.floor(x).astype(np.int64)
     x1 = x0 + 1
-    y0 = int(np.floor(y))
+    y0 = np.floor(y).astype(np.int64)
     y1 = y0 + 1
     
     # Interpolation weights
@@ -57,14 +71,63 @@ def perlin_noise(x, y, scale=1.0):
 
 def create_flow_field(grid_size, scale):
     """Generate flow field from noise"""
-    field = np.zeros((grid_size, grid_size))
+    i, j = np.meshgrid(np.arange(grid_size), np.arange(grid_size),
+                       indexing='ij')
+    return perlin_noise(i, j, scale) * 2 * np.pi * 2
+
+if HAS_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def trace_kernel(cos_field, sin_field, starts, steps, step_size):
+        """Trace every particle through the flow field, one per thread"""
+        grid_size = cos_field.shape[0]
+        paths = np.empty((starts.shape[0], steps + 1, 2))
+        
+        for p in prange(starts.shape[0]):
+            x = starts[p, 0]
+            y = starts[p, 1]
+            paths[p, 0, 0] = x
+            paths[p, 0, 1] = y
+            
+            for step in range(steps):
+                i = int(x) % grid_size
+                j = int(y) % grid_size
+                x = (x + cos_field[i, j] * step_size) % grid_size
+                y = (y + sin_field[i, j] * step_size) % grid_size
+                paths[p, step + 1, 0] = x
+                paths[p, step + 1, 1] = y
+        
+        return paths
+
+def trace_particles(flow_field, starts, steps, step_size):
+    """Follow the flow field from each start, returning (particles, steps+1, 2)"""
+    # Direction per cell, computed once instead of per particle step
+    cos_field = np.cos(flow_field)
+    sin_field = np.sin(flow_field)
+    
+    if HAS_NUMBA:
+        return trace_kernel(cos_field, sin_field, starts, steps, step_size)
     
-    for i in range(grid_size):
-        for j in range(grid_size):
-            angle = perlin_noise(i, j, scale) * 2 * np.pi * 2
-            field[i, j] = angle
+    grid_size = flow_field.shape[0]
+    paths = np.empty((len(starts), steps + 1, 2))
+    x = starts[:, 0].copy()
+    y = starts[:, 1].copy()
+    paths[:, 0, 0] = x
+    paths[:, 0, 1] = y
+    
+    # Advance all particles together
+    for step in range(steps):
+        # Get flow direction at current positions
+        i = x.astype(int) % grid_size
+        j = y.astype(int) % grid_size
+        
+        # Move particles and wrap around boundaries
+        x = (x + cos_field[i, j] * step_size) % grid_size
+        y = (y + sin_field[i, j] * step_size) % grid_size
+        
+        paths[:, step + 1, 0] = x
+        paths[:, step + 1, 1] = y
     
-    return field
+    return paths
 
 def create_perlin_noise_flow():
     """Create flow field art"""
@@ -83,46 +146,21 @@ def create_perlin_noise_flow():
     
     cmap = plt.get_cmap(COLORMAP)
     
-    # Generate particles
-    for p in range(NUM_PARTICLES):
-        # Random starting position
-        x = np.random.rand() * GRID_SIZE
-        y = np.random.rand() * GRID_SIZE
-        
-        path = [(x, y)]
-        
-        # Follow flow field
-        for step in range(STEPS_PER_PARTICLE):
-            # Get flow angle at current position
-            i = int(x) % GRID_SIZE
-            j = int(y) % GRID_SIZE
-            angle = flow_field[i, j]
-            
-            # Move particle
-            x += np.cos(angle) * STEP_SIZE
-            y += np.sin(angle) * STEP_SIZE
-            
-            # Wrap around boundaries
-            x = x % GRID_SIZE
-            y = y % GRID_SIZE
-            
-            path.append((x, y))
-        
-        # Draw path
-        path = np.array(path)
-        points = path.reshape(-1, 1, 2)
-        segments = np.concatenate([points[:-1], points[1:]], axis=1)
-        
-        # Color gradient
-        colors = np.linspace(0, 1, len(segments))
-        
-        lc = LineCollection(segments, cmap=COLORMAP,
-                           linewidth=LINE_WIDTH, alpha=ALPHA)
-        lc.set_array(colors)
-        ax.add_collection(lc)
-        
-        if (p + 1) % 50 == 0:
-            print(f"  Drawn {p + 1}/{NUM_PARTICLES} particles")
+    # Random starting positions, then follow the flow field
+    starts = np.random.rand(NUM_PARTICLES, 2) * GRID_SIZE
+    paths = trace_particles(flow_field, starts, STEPS_PER_PARTICLE, STEP_SIZE)
+    
+    # Line segments for all paths, grouped by particle
+    segments = np.stack([paths[:, :-1], paths[:, 1:]], axis=2).reshape(-1, 2, 2)
+    
+    # Color gradient along each path, mapped once and shared by all
+    colors = np.tile(cmap(np.linspace(0, 1, STEPS_PER_PARTICLE)),
+                     (NUM_PARTICLES, 1))
+    
+    # Draw all paths as a single collection
+    lc = LineCollection(segments, colors=colors,
+                       linewidth=LINE_WIDTH, alpha=ALPHA)
+    ax.add_collection(lc)
     
     ax.set_xlim(0, GRID_SIZE)
     ax.set_ylim(0, GRID_SIZE)
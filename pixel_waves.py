@@ -6,6 +6,13 @@ Creates wave interference patterns using pixel manipulation
 import numpy as np
 import matplotlib.pyplot as plt
 
+# numexpr is optional; fall back to in-place NumPy when it isn't installed
+try:
+    import numexpr as ne
+    HAS_NUMEXPR = True
+except ImportError:
+    HAS_NUMEXPR = False
+
 # Parameters
 WIDTH = 800
 HEIGHT = 800
@@ -21,13 +28,13 @@ def create_pixel_waves():
     
     print("Calculating wave interference...")
     
-    # Create coordinate grid
-    x = np.linspace(-10, 10, WIDTH)
-    y = np.linspace(-10, 10, HEIGHT)
-    X, Y = np.meshgrid(x, y)
+    # Create coordinate grid (float32 halves memory traffic)
+    x = np.linspace(-10, 10, WIDTH, dtype=np.float32)
+    y = np.linspace(-10, 10, HEIGHT, dtype=np.float32)
     
-    # Initialize wave field
-    wave_field = np.zeros((HEIGHT, WIDTH))
+    # Initialize wave field and a scratch buffer reused for every source
+    wave_field = np.zeros((HEIGHT, WIDTH), dtype=np.float32)
+    wave = np.empty_like(wave_field)
     
     # Generate random wave sources
     sources = []
@@ -40,14 +47,30 @@ def create_pixel_waves():
     
     # Calculate interference pattern
     for sx, sy, freq, phase in sources:
-        # Distance from source
-        distance = np.sqrt((X - sx)**2 + (Y - sy)**2)
-        
-        # Wave contribution
-        wave = AMPLITUDE * np.sin(2 * np.pi * freq * distance + phase)
-        
-        # Add to field
-        wave_field += wave
+        if HAS_NUMEXPR:
+            # Whole contribution in one fused, threaded pass
+            ne.evaluate("wave_field + amp * sin(k * sqrt((xs - sx)**2 + (ys - sy)**2) + phase)",
+                        local_dict={'wave_field': wave_field,
+                                    'xs': x[None, :], 'ys': y[:, None],
+                                    'sx': np.float32(sx), 'sy': np.float32(sy),
+                                    'k': np.float32(2 * np.pi * freq),
+                                    'phase': np.float32(phase),
+                                    'amp': np.float32(AMPLITUDE)},
+                        out=wave_field, casting='same_kind')
+        else:
+            # Distance from source, broadcasting row and column offsets
+            dx = x - np.float32(sx)
+            dy = y - np.float32(sy)
+            np.hypot(dx[None, :], dy[:, None], out=wave)
+            
+            # Wave contribution, computed in place
+            wave *= np.float32(2 * np.pi * freq)
+            wave += np.float32(phase)
+            np.sin(wave, out=wave)
+            wave *= np.float32(AMPLITUDE)
+            
+            # Add to field
+            wave_field += wave
     
     # Normalize
     wave_field = (wave_field - wave_field.min()) / (wave_field.max() - wave_field.min())
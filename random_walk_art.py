@@ -28,32 +28,29 @@ def create_random_walk_art():
     # Initialize walkers at random positions
     walkers = np.random.randn(NUM_WALKERS, 2) * 2
     
-    # Store all trajectories
-    all_trajectories = [[] for _ in range(NUM_WALKERS)]
+    # Store all trajectories, one row per step
+    all_trajectories = np.empty((STEPS_PER_WALKER, NUM_WALKERS, 2))
     
-    # Simulate walks
+    # Simulate walks, moving all walkers together each step
     for step in range(STEPS_PER_WALKER):
-        for i in range(NUM_WALKERS):
-            # Random walk component
-            random_step = np.random.randn(2) * STEP_SIZE
-            
-            # Attraction to center
-            center_force = -walkers[i] * ATTRACTION_TO_CENTER
-            
-            # Repulsion from other walkers
-            repulsion = np.zeros(2)
-            for j in range(NUM_WALKERS):
-                if i != j:
-                    diff = walkers[i] - walkers[j]
-                    dist = np.linalg.norm(diff) + 0.1
-                    if dist < 2.0:  # Only repel if close
-                        repulsion += diff / dist**2 * REPULSION_FROM_OTHERS
-            
-            # Update position
-            walkers[i] += random_step + center_force + repulsion
-            
-            # Store position
-            all_trajectories[i].append(walkers[i].copy())
+        # Random walk component
+        random_steps = np.random.randn(NUM_WALKERS, 2) * STEP_SIZE
+        
+        # Attraction to center
+        center_force = -walkers * ATTRACTION_TO_CENTER
+        
+        # Repulsion from other walkers, from all pairwise differences at once
+        diff = walkers[:, None, :] - walkers[None, :, :]
+        dist = np.sqrt((diff**2).sum(axis=-1)) + 0.1
+        close = dist < 2.0  # Only repel if close
+        np.fill_diagonal(close, False)
+        repulsion = (diff / (dist**2)[..., None] * close[..., None]).sum(axis=1)
+        
+        # Update positions
+        walkers += random_steps + center_force + repulsion * REPULSION_FROM_OTHERS
+        
+        # Store positions
+        all_trajectories[step] = walkers
     
     print("Creating visualization...")
     
@@ -64,28 +61,20 @@ def create_random_walk_art():
     
     cmap = plt.get_cmap(COLORMAP)
     
-    # Plot each trajectory
-    for i, trajectory in enumerate(all_trajectories):
-        points = np.array(trajectory)
-        
-        # Create line segments
-        segments = []
-        for j in range(len(points) - 1):
-            segments.append([points[j], points[j + 1]])
-        
-        # Color gradient
-        colors = np.linspace(0, 1, len(segments))
-        
-        # Color based on walker ID
-        walker_color = cmap(i / NUM_WALKERS)
-        
-        lc = LineCollection(segments, colors=[walker_color] * len(segments),
-                           linewidths=LINE_WIDTH, alpha=ALPHA)
-        ax.add_collection(lc)
+    # Line segments for all trajectories, grouped by walker
+    paths = all_trajectories.transpose(1, 0, 2)
+    segments = np.stack([paths[:, :-1], paths[:, 1:]], axis=2).reshape(-1, 2, 2)
+    
+    # Color based on walker ID, mapped once for all walkers
+    walker_colors = cmap(np.arange(NUM_WALKERS) / NUM_WALKERS)
+    colors = np.repeat(walker_colors, STEPS_PER_WALKER - 1, axis=0)
+    
+    lc = LineCollection(segments, colors=colors,
+                       linewidths=LINE_WIDTH, alpha=ALPHA)
+    ax.add_collection(lc)
     
     # Calculate bounds
-    all_points = np.vstack([np.array(traj) for traj in all_trajectories])
-    max_range = np.max(np.abs(all_points)) * 1.1
+    max_range = np.max(np.abs(all_trajectories)) * 1.1
     
     ax.set_xlim(-max_range, max_range)
     ax.set_ylim(-max_range, max_range)
@@ -3,6 +3,7 @@ Recursive Tree - Algorithmic Art
 Creates a beautiful fractal tree using recursion with gradient coloring
 """
 
+import math
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.collections import LineCollection
@@ -21,38 +22,57 @@ OUTPUT_FILE = 'recursive_tree.jpg'
 
 class TreeDrawer:
     def __init__(self):
-        self.segments = []
-        self.depths = []
+        self.segments = np.empty((0, 2, 2))
+        self.depths = np.empty(0, dtype=np.int32)
     
     def draw_branch(self, x, y, angle, length, depth, max_depth):
-        """Recursively draw tree branches"""
+        """Draw tree branches depth-first with an explicit stack"""
         
-        if length < MIN_LENGTH or depth > max_depth:
-            return
+        # Buffers start small and double when full, since MIN_LENGTH
+        # prunes far below the 3**levels worst case
+        capacity = 1024
+        segments = np.empty((capacity, 2, 2))
+        depths = np.empty(capacity, dtype=np.int32)
+        count = 0
         
-        # Calculate end point
-        x_end = x + length * np.cos(np.radians(angle))
-        y_end = y + length * np.sin(np.radians(angle))
+        stack = [(x, y, angle, length, depth)]
+        while stack:
+            x, y, angle, length, depth = stack.pop()
+            
+            if length < MIN_LENGTH or depth > max_depth:
+                continue
+            
+            # Calculate end point
+            x_end = x + length * math.cos(math.radians(angle))
+            y_end = y + length * math.sin(math.radians(angle))
+            
+            # Store segment and depth
+            if count == capacity:
+                capacity *= 2
+                segments = np.resize(segments, (capacity, 2, 2))
+                depths = np.resize(depths, capacity)
+            segments[count] = ((x, y), (x_end, y_end))
+            depths[count] = depth
+            count += 1
+            
+            new_length = length * LENGTH_RATIO
+            
+            # Optional: center branch (creates denser tree), pushed first
+            # so it is drawn after the left and right branches
+            if depth < max_depth - 2 and np.random.rand() > 0.7:
+                stack.append((x_end, y_end, angle, new_length * 0.8, depth + 1))
+            
+            # Children are pushed in reverse so left is drawn first
+            # Right branch
+            stack.append((x_end, y_end, angle - BRANCH_ANGLE,
+                          new_length, depth + 1))
+            
+            # Left branch
+            stack.append((x_end, y_end, angle + BRANCH_ANGLE,
+                          new_length, depth + 1))
         
-        # Store segment and depth
-        self.segments.append([(x, y), (x_end, y_end)])
-        self.depths.append(depth)
-        
-        # Recurse for left and right branches
-        new_length = length * LENGTH_RATIO
-        
-        # Left branch
-        self.draw_branch(x_end, y_end, angle + BRANCH_ANGLE, 
-                        new_length, depth + 1, max_depth)
-        
-        # Right branch
-        self.draw_branch(x_end, y_end, angle - BRANCH_ANGLE, 
-                        new_length, depth + 1, max_depth)
-        
-        # Optional: center branch (creates denser tree)
-        if depth < max_depth - 2 and np.random.rand() > 0.7:
-            self.draw_branch(x_end, y_end, angle, 
-                           new_length * 0.8, depth + 1, max_depth)
+        self.segments = np.concatenate([self.segments, segments[:count]])
+        self.depths = np.concatenate([self.depths, depths[:count]])
 
 def create_recursive_tree():
     """Create recursive tree visualization"""
@@ -74,12 +94,11 @@ def create_recursive_tree():
     cmap = plt.get_cmap(COLORMAP)
     
     # Normalize depths for coloring
-    max_depth = max(tree.depths)
-    colors = [cmap(d / max_depth) for d in tree.depths]
+    max_depth = tree.depths.max()
+    colors = cmap(tree.depths / max_depth)
     
     # Calculate line widths (thicker at base, thinner at tips)
-    widths = [LINE_WIDTH_BASE * (1 - d / max_depth) ** 2 + 0.3 
-              for d in tree.depths]
+    widths = LINE_WIDTH_BASE * (1 - tree.depths / max_depth) ** 2 + 0.3
     
     # Create line collection
     lc = LineCollection(tree.segments, colors=colors, 
@@ -87,7 +106,7 @@ def create_recursive_tree():
     ax.add_collection(lc)
     
     # Calculate bounds
-    all_points = np.array([pt for seg in tree.segments for pt in seg])
+    all_points = tree.segments.reshape(-1, 2)
     x_min, x_max = all_points[:, 0].min(), all_points[:, 0].max()
     y_min, y_max = all_points[:, 1].min(), all_points[:, 1].max()
     
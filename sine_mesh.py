@@ -5,6 +5,7 @@ Creates a 3D-looking mesh deformed by sine waves
 
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 
 # Parameters
 GRID_SIZE = 40
@@ -44,35 +45,21 @@ def create_sine_mesh():
     # Normalize Z for coloring
     Z_norm = (Z - Z.min()) / (Z.max() - Z.min())
     
-    # Draw horizontal lines
-    for i in range(GRID_SIZE):
-        # Apply perspective: scale by Z value
-        scale = 1 + Z[i, :] * 0.5
-        x_scaled = X[i, :] * scale
-        y_scaled = Y[i, :] * scale
-        
-        # Color based on Z
-        colors = cmap(Z_norm[i, :])
-        
-        for j in range(GRID_SIZE - 1):
-            ax.plot([x_scaled[j], x_scaled[j+1]], 
-                   [y_scaled[j], y_scaled[j+1]], 
-                   color=colors[j], linewidth=LINE_WIDTH, 
-                   alpha=ALPHA)
+    # Apply perspective: scale by Z value
+    scale = 1 + Z * 0.5
+    points = np.stack([X * scale, Y * scale], axis=-1)
+    
+    # Draw horizontal lines, colored by Z at each segment start
+    h_segments = np.stack([points[:, :-1], points[:, 1:]], axis=2).reshape(-1, 2, 2)
+    h_colors = cmap(Z_norm[:, :-1].ravel())
+    ax.add_collection(LineCollection(h_segments, colors=h_colors,
+                                     linewidths=LINE_WIDTH, alpha=ALPHA))
     
     # Draw vertical lines
-    for j in range(GRID_SIZE):
-        scale = 1 + Z[:, j] * 0.5
-        x_scaled = X[:, j] * scale
-        y_scaled = Y[:, j] * scale
-        
-        colors = cmap(Z_norm[:, j])
-        
-        for i in range(GRID_SIZE - 1):
-            ax.plot([x_scaled[i], x_scaled[i+1]], 
-                   [y_scaled[i], y_scaled[i+1]], 
-                   color=colors[i], linewidth=LINE_WIDTH, 
-                   alpha=ALPHA)
+    v_segments = np.stack([points[:-1, :], points[1:, :]], axis=2).reshape(-1, 2, 2)
+    v_colors = cmap(Z_norm[:-1, :].ravel())
+    ax.add_collection(LineCollection(v_segments, colors=v_colors,
+                                     linewidths=LINE_WIDTH, alpha=ALPHA))
     
     max_extent = 5 * 1.5
     ax.set_xlim(-max_extent, max_extent)
@@ -5,7 +5,7 @@ Creates a golden spiral pattern with nested circles and gradient coloring
 
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.patches import Circle
+from matplotlib.collections import EllipseCollection
 import matplotlib.colors as mcolors
 
 # Parameters
@@ -29,26 +29,30 @@ def create_spiral_circles():
     cmap = plt.get_cmap(COLORMAP)
     
     # Generate spiral points
-    for i in range(NUM_CIRCLES):
-        # Polar coordinates with golden angle
-        angle = i * np.radians(ROTATION_SPEED)
-        radius = SPIRAL_TIGHTNESS * np.sqrt(i)
-        
-        # Convert to cartesian
-        x = radius * np.cos(angle)
-        y = radius * np.sin(angle)
-        
-        # Circle size decreases with distance
-        circle_size = 0.5 * (1 - i / NUM_CIRCLES) + 0.1
-        
-        # Color based on position
-        color = cmap(i / NUM_CIRCLES)
-        
-        # Add circle
-        circle = Circle((x, y), circle_size, 
-                       color=color, alpha=0.6, 
-                       linewidth=1, edgecolor=color)
-        ax.add_patch(circle)
+    i = np.arange(NUM_CIRCLES)
+    
+    # Polar coordinates with golden angle
+    angle = i * np.radians(ROTATION_SPEED)
+    radius = SPIRAL_TIGHTNESS * np.sqrt(i)
+    
+    # Convert to cartesian
+    x = radius * np.cos(angle)
+    y = radius * np.sin(angle)
+    
+    # Circle size decreases with distance
+    circle_size = 0.5 * (1 - i / NUM_CIRCLES) + 0.1
+    
+    # Color based on position
+    colors = cmap(i / NUM_CIRCLES)
+    
+    # Add all circles as one collection sized in data units
+    diameters = 2 * circle_size
+    circles = EllipseCollection(diameters, diameters, 0, units='xy',
+                                offsets=np.column_stack([x, y]),
+                                offset_transform=ax.transData,
+                                facecolors=colors, edgecolors=colors,
+                                linewidths=1, alpha=0.6)
+    ax.add_collection(circles)
     
     # Set limits and aspect
     max_radius = SPIRAL_TIGHTNESS * np.sqrt(NUM_CIRCLES) + 1
@@ -3,9 +3,19 @@ Stippling Art - Algorithmic Art
 Creates stippled/pointillism patterns using weighted random sampling
 """
 
+import math
+import os
+import zipfile
 import numpy as np
 import matplotlib.pyplot as plt
 
+# Numba is optional; fall back to pure NumPy when it isn't installed
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 # Parameters
 NUM_DOTS = 10000
 IMAGE_TYPE = 'radial'  # 'radial', 'spiral', 'waves'
@@ -14,12 +24,49 @@ DOT_SIZE_VARIATION = True
 COLORMAP = 'inferno'
 COLOR_BY_DENSITY = True
 BACKGROUND = '#ffffff'
+SIZE_CLASSES = 5  # Distinct dot sizes drawn when dots share one color
+MIN_ACCEPT_RATE = 0.1  # Use rejection sampling when at least this many draws hit
 DPI = 150
 OUTPUT_FILE = 'stippling_art.jpg'
+SEED = None  # Set an int for reproducible dot placement
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')  # Density fields and alias tables are reused from here, None disables
+CACHE_VERSION = 2  # Bump whenever the density patterns or alias tables change
+
+# Density patterns, indexed by the kind passed to the kernel
+PATTERNS = {'radial': 0, 'spiral': 1, 'waves': 2}
+
+if HAS_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def density_kernel(kind, width, height):
+        """Evaluate the density pattern in a single pass, one row per thread"""
+        density = np.empty((height, width))
+        dx = 2.0 / (width - 1)
+        dy = 2.0 / (height - 1)
+        
+        for j in prange(height):
+            y = -1.0 + j * dy
+            for i in range(width):
+                x = -1.0 + i * dx
+                if kind == 0:
+                    r = math.sqrt(x*x + y*y)
+                    density[j, i] = min(max(1.0 - r, 0.0), 1.0)
+                elif kind == 1:
+                    r = math.sqrt(x*x + y*y)
+                    theta = math.atan2(y, x)
+                    density[j, i] = math.sin(5 * theta + 10 * r) * 0.5 + 0.5
+                else:
+                    # The wave sum dips below zero; those troughs get no dots
+                    wave = (math.sin(10 * x) + math.sin(10 * y)) * 0.5 + 0.5
+                    density[j, i] = max(wave, 0.0)
+        
+        return density
 
 def generate_density_field(width, height, pattern_type='radial'):
     """Generate a density field for stippling"""
     
+    if HAS_NUMBA:
+        return density_kernel(PATTERNS[pattern_type], width, height)
+    
     x = np.linspace(-1, 1, width)
     y = np.linspace(-1, 1, height)
     X, Y = np.meshgrid(x, y)
@@ -37,26 +84,154 @@ def generate_density_field(width, height, pattern_type='radial'):
         density = np.sin(5 * theta + 10 * R) * 0.5 + 0.5
     
     elif pattern_type == 'waves':
-        # Wave interference
+        # Wave interference, clipped where the sum dips below zero
         density = (np.sin(10 * X) + np.sin(10 * Y)) * 0.5 + 0.5
+        density = np.clip(density, 0, None)
     
     return density
 
+if HAS_NUMBA:
+    @njit(cache=True)
+    def build_alias_table(weights):
+        """Vose's alias table for sampling indices proportionally to weights"""
+        n = weights.size
+        prob = weights * (n / weights.sum())
+        alias = np.arange(n)
+        
+        # Stacks of bins below and above the average weight
+        small = np.empty(n, dtype=np.int64)
+        large = np.empty(n, dtype=np.int64)
+        num_small = 0
+        num_large = 0
+        for i in range(n):
+            if prob[i] < 1.0:
+                small[num_small] = i
+                num_small += 1
+            else:
+                large[num_large] = i
+                num_large += 1
+        
+        # Top up each small bin with the excess of a large one
+        while num_small > 0 and num_large > 0:
+            num_small -= 1
+            s = small[num_small]
+            l = large[num_large - 1]
+            alias[s] = l
+            prob[l] -= 1.0 - prob[s]
+            if prob[l] < 1.0:
+                num_large -= 1
+                small[num_small] = l
+                num_small += 1
+        
+        # Whatever is left is full up to rounding error
+        for k in range(num_large):
+            prob[large[k]] = 1.0
+        for k in range(num_small):
+            prob[small[k]] = 1.0
+        
+        return prob, alias
+    
+    @njit(cache=True)
+    def seed_numba(seed):
+        """Seed the generator used inside jitted functions"""
+        np.random.seed(seed)
+    
+    @njit(cache=True)
+    def sample_alias(prob, alias, count):
+        """
+        Draw count indices from an alias table, O(1) per sample.
+        Serial, since only the calling thread's generator is seeded.
+        """
+        n = prob.size
+        out = np.empty(count, dtype=np.int64)
+        for k in range(count):
+            i = np.random.randint(0, n)
+            if np.random.random() < prob[i]:
+                out[k] = i
+            else:
+                out[k] = alias[i]
+        return out
+
+def load_or_compute(name, compute):
+    """
+    Arrays cached in CACHE_DIR/name_vCACHE_VERSION.npz, computed and saved
+    on a miss. Unreadable cache files count as a miss.
+    """
+    if CACHE_DIR is None:
+        return compute()
+    
+    path = os.path.join(CACHE_DIR, f'{name}_v{CACHE_VERSION}.npz')
+    try:
+        with np.load(path) as data:
+            return tuple(data[f'arr_{i}'] for i in range(len(data.files)))
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+        print(f"Ignoring unreadable cache file {path}")
+    
+    arrays = compute()
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    np.savez(path, *arrays)
+    return arrays
+
+def sample_rejection(weights, count, peak, rate, rng):
+    """Draw count flat indices by accepting uniform draws with weights/peak"""
+    accepted = []
+    remaining = count
+    while remaining > 0:
+        # Enough candidates that one batch usually suffices
+        batch = int(remaining / rate * 1.2) + 64
+        candidates = rng.integers(0, len(weights), batch)
+        keep = candidates[rng.random(batch) * peak < weights[candidates]]
+        accepted.append(keep[:remaining])
+        remaining -= len(accepted[-1])
+    return np.concatenate(accepted)
+
+def sample_indices(weights, count, rng, cache_name=None):
+    """
+    Draw count flat indices with probability proportional to weights,
+    using rng (or a numba generator seeded from it).
+    Any alias table built is cached under cache_name when one is given.
+    """
+    if weights.min() < 0:
+        raise ValueError("weights must be non-negative")
+    
+    # Dense fields accept often enough that no table is worth building
+    peak = weights.max()
+    rate = weights.mean() / peak
+    if rate >= MIN_ACCEPT_RATE:
+        return sample_rejection(weights, count, peak, rate, rng)
+    
+    if HAS_NUMBA:
+        if cache_name is None:
+            prob, alias = build_alias_table(weights)
+        else:
+            prob, alias = load_or_compute(f'{cache_name}_alias',
+                                          lambda: build_alias_table(weights))
+        seed_numba(rng.integers(2**32))
+        return sample_alias(prob, alias, count)
+    
+    # Inverse transform sampling on the cumulative weights
+    cdf = np.cumsum(weights)
+    indices = np.searchsorted(cdf, rng.random(count) * cdf[-1], side='right')
+    return np.minimum(indices, len(weights) - 1)
+
 def create_stippling_art():
     """Create stippled art using density-based sampling"""
     
     print("Generating stippling pattern...")
     
-    # Generate density field
-    width, height = 500, 500
-    density = generate_density_field(width, height, IMAGE_TYPE)
+    # PCG64 generator for all sampling, fresh each run so SEED reproduces it
+    rng = np.random.default_rng(SEED)
     
-    # Normalize to probability
-    prob = density.flatten()
-    prob = prob / prob.sum()
+    # Generate density field, reusing a cached one for the same pattern
+    width, height = 500, 500
+    cache_name = f'density_{IMAGE_TYPE}_{width}x{height}'
+    density, = load_or_compute(
+        cache_name, lambda: (generate_density_field(width, height, IMAGE_TYPE),))
     
     # Sample points according to density
-    flat_indices = np.random.choice(len(prob), NUM_DOTS, replace=True, p=prob)
+    flat_indices = sample_indices(density.ravel(), NUM_DOTS, rng, cache_name)
     y_indices, x_indices = np.unravel_index(flat_indices, density.shape)
     
     # Convert to coordinates
@@ -77,17 +252,26 @@ def create_stippling_art():
     if DOT_SIZE_VARIATION:
         sizes = DOT_SIZE * (densities * 2 + 0.5)
     else:
-        sizes = DOT_SIZE
+        sizes = np.full(len(densities), DOT_SIZE)
     
     # Determine colors
     if COLOR_BY_DENSITY:
+        # Map through the colormap once, with the dot alpha baked into
+        # the RGBA array rather than applied on top by the collection
         cmap = plt.get_cmap(COLORMAP)
         colors = cmap(densities)
+        colors[:, 3] = 0.7
         scatter = ax.scatter(x_coords, y_coords, s=sizes, 
-                           c=densities, cmap=COLORMAP, alpha=0.7)
+                           c=colors, rasterized=True)
     else:
-        scatter = ax.scatter(x_coords, y_coords, s=sizes, 
-                           c='black', alpha=0.7)
+        # One constant-size scatter per size class, so each is stamped
+        # as a single repeated marker instead of a path per dot
+        levels = np.linspace(sizes.min(), sizes.max(), SIZE_CLASSES)
+        classes = np.abs(sizes[:, None] - levels).argmin(axis=1)
+        for c in np.unique(classes):
+            in_class = classes == c
+            ax.scatter(x_coords[in_class], y_coords[in_class], s=levels[c],
+                      c='black', alpha=0.7, rasterized=True)
     
     ax.set_xlim(-1, 1)
     ax.set_ylim(-1, 1)
@@ -8,14 +8,23 @@ import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 from matplotlib.collections import LineCollection
 
+# Numba is optional; fall back to pure Python when it isn't installed
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 # Parameters
 ATTRACTOR_TYPE = 'lorenz'  # 'lorenz', 'rossler', 'aizawa'
-NUM_STEPS = 50000
-DT = 0.01
+NUM_STEPS = 25000
+DT = 0.02
 COLORMAP = 'plasma'
 BACKGROUND = '#000000'
 LINE_WIDTH = 0.3
 ALPHA = 0.6
+NUM_TRAJECTORIES = 1  # More than 1 renders an ensemble, integrated in parallel
+ENSEMBLE_SPREAD = 0.5  # Spread of the extra trajectories' initial conditions
 VIEW_3D = False  # Set True for 3D view
 DPI = 150
 OUTPUT_FILE = 'strange_attractor.jpg'
@@ -41,34 +50,102 @@ def aizawa(x, y, z, a=0.95, b=0.7, c=0.6, d=3.5, e=0.25, f=0.1):
     dz = c + a * z - (z**3 / 3) - (x**2 + y**2) * (1 + e * z) + f * z * x**3
     return dx, dy, dz
 
+def rk4_step(f, x, y, z, dt):
+    """Advance (x, y, z) by one classical Runge-Kutta step of the system f"""
+    k1x, k1y, k1z = f(x, y, z)
+    k2x, k2y, k2z = f(x + 0.5*dt*k1x, y + 0.5*dt*k1y, z + 0.5*dt*k1z)
+    k3x, k3y, k3z = f(x + 0.5*dt*k2x, y + 0.5*dt*k2y, z + 0.5*dt*k2z)
+    k4x, k4y, k4z = f(x + dt*k3x, y + dt*k3y, z + dt*k3z)
+    return (x + dt * (k1x + 2*k2x + 2*k3x + k4x) / 6,
+            y + dt * (k1y + 2*k2y + 2*k3y + k4y) / 6,
+            z + dt * (k1z + 2*k2z + 2*k3z + k4z) / 6)
+
+# Attractor functions, indexed by the kind passed to the integrator
+ATTRACTORS = {'lorenz': 0, 'rossler': 1, 'aizawa': 2}
+
+if HAS_NUMBA:
+    _lorenz = njit(cache=True, fastmath=True)(lorenz)
+    _rossler = njit(cache=True, fastmath=True)(rossler)
+    _aizawa = njit(cache=True, fastmath=True)(aizawa)
+    _rk4_step = njit(inline='always', fastmath=True)(rk4_step)
+    
+    @njit(cache=True, fastmath=True)
+    def _integrate(kind, dt, x, y, z, xs, ys, zs):
+        """RK4 integration from (x, y, z) in double, storing into xs, ys, zs"""
+        xs[0], ys[0], zs[0] = x, y, z
+        
+        for i in range(len(xs) - 1):
+            if kind == 0:
+                x, y, z = _rk4_step(_lorenz, x, y, z, dt)
+            elif kind == 1:
+                x, y, z = _rk4_step(_rossler, x, y, z, dt)
+            else:
+                x, y, z = _rk4_step(_aizawa, x, y, z, dt)
+            xs[i + 1] = x
+            ys[i + 1] = y
+            zs[i + 1] = z
+    
+    @njit(parallel=True, cache=True, fastmath=True)
+    def simulate_kernel(kind, starts, n, dt):
+        """Integrate every trajectory in native code, one per thread"""
+        xs = np.empty((starts.shape[0], n + 1), dtype=np.float32)
+        ys = np.empty_like(xs)
+        zs = np.empty_like(xs)
+        
+        for t in prange(starts.shape[0]):
+            _integrate(kind, dt, starts[t, 0], starts[t, 1], starts[t, 2],
+                       xs[t], ys[t], zs[t])
+        
+        return xs, ys, zs
+
+def simulate(attractor_type, starts, n, dt):
+    """
+    Integrate the attractor from each (x, y, z) row of starts.
+    Returns float32 xs, ys, zs arrays of shape (trajectories, n + 1).
+    """
+    kind = ATTRACTORS[attractor_type]
+    if HAS_NUMBA:
+        return simulate_kernel(kind, starts, n, dt)
+    
+    attractor_func = (lorenz, rossler, aizawa)[kind]
+    xs = np.empty((len(starts), n + 1), dtype=np.float32)
+    ys = np.empty_like(xs)
+    zs = np.empty_like(xs)
+    
+    for t, (x, y, z) in enumerate(starts):
+        xs[t, 0], ys[t, 0], zs[t, 0] = x, y, z
+        for i in range(n):
+            x, y, z = rk4_step(attractor_func, x, y, z, dt)
+            xs[t, i + 1] = x
+            ys[t, i + 1] = y
+            zs[t, i + 1] = z
+    
+    return xs, ys, zs
+
+def build_segments(xs, ys):
+    """Line segments of every trajectory, with colors by time"""
+    # Write straight into one preallocated array, grouped by trajectory
+    steps = xs.shape[1] - 1
+    segments = np.empty((xs.shape[0], steps, 2, 2), dtype=xs.dtype)
+    segments[:, :, 0, 0] = xs[:, :-1]
+    segments[:, :, 0, 1] = ys[:, :-1]
+    segments[:, :, 1, 0] = xs[:, 1:]
+    segments[:, :, 1, 1] = ys[:, 1:]
+    colors = np.tile(np.arange(steps) / steps, xs.shape[0])
+    return segments.reshape(-1, 2, 2), colors
+
 def create_strange_attractor():
     """Generate and visualize strange attractor"""
     
     print(f"Simulating {ATTRACTOR_TYPE} attractor...")
     
-    # Initial conditions
-    x, y, z = 0.1, 0.0, 0.0
-    
-    # Store trajectory
-    xs, ys, zs = [x], [y], [z]
-    
-    # Select attractor
-    if ATTRACTOR_TYPE == 'lorenz':
-        attractor_func = lorenz
-    elif ATTRACTOR_TYPE == 'rossler':
-        attractor_func = rossler
-    elif ATTRACTOR_TYPE == 'aizawa':
-        attractor_func = aizawa
+    # Initial conditions, with any extra trajectories scattered around them
+    starts = np.empty((NUM_TRAJECTORIES, 3))
+    starts[:] = 0.1, 0.0, 0.0
+    starts[1:] += np.random.randn(NUM_TRAJECTORIES - 1, 3) * ENSEMBLE_SPREAD
     
     # Simulate
-    for _ in range(NUM_STEPS):
-        dx, dy, dz = attractor_func(x, y, z)
-        x += dx * DT
-        y += dy * DT
-        z += dz * DT
-        xs.append(x)
-        ys.append(y)
-        zs.append(z)
+    xs, ys, zs = simulate(ATTRACTOR_TYPE, starts, NUM_STEPS, DT)
     
     print("Creating visualization...")
     
@@ -79,18 +156,13 @@ def create_strange_attractor():
         ax = fig.add_subplot(111, projection='3d')
         ax.set_facecolor(BACKGROUND)
         
-        # Plot 3D
-        points = np.array([xs, ys, zs]).T.reshape(-1, 1, 3)
-        segments = np.concatenate([points[:-1], points[1:]], axis=1)
-        
-        colors = np.linspace(0, 1, len(segments))
-        
         # Note: 3D LineCollection is tricky, using plot instead
         cmap = plt.get_cmap(COLORMAP)
-        for i in range(0, len(xs)-1, 50):
-            color = cmap(i / len(xs))
-            ax.plot(xs[i:i+50], ys[i:i+50], zs[i:i+50], 
-                   color=color, linewidth=LINE_WIDTH, alpha=ALPHA)
+        for tx, ty, tz in zip(xs, ys, zs):
+            for i in range(0, len(tx)-1, 50):
+                color = cmap(i / len(tx))
+                ax.plot(tx[i:i+50], ty[i:i+50], tz[i:i+50], 
+                       color=color, linewidth=LINE_WIDTH, alpha=ALPHA)
         
         ax.axis('off')
         ax.grid(False)
@@ -101,18 +173,15 @@ def create_strange_attractor():
         ax.set_facecolor(BACKGROUND)
         
         # Create line segments for gradient
-        points = np.array([xs, ys]).T.reshape(-1, 1, 2)
-        segments = np.concatenate([points[:-1], points[1:]], axis=1)
-        
-        colors = np.linspace(0, 1, len(segments))
+        segments, colors = build_segments(xs, ys)
         
         lc = LineCollection(segments, cmap=COLORMAP, 
                            linewidth=LINE_WIDTH, alpha=ALPHA)
         lc.set_array(colors)
         ax.add_collection(lc)
         
-        ax.set_xlim(min(xs), max(xs))
-        ax.set_ylim(min(ys), max(ys))
+        ax.set_xlim(xs.min(), xs.max())
+        ax.set_ylim(ys.min(), ys.max())
         ax.set_aspect('equal')
         ax.axis('off')
     
@@ -0,0 +1,84 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Compiled 2-opt kernel for mandelbrotTSP1.py
+Ahead-of-time alternative to the Numba kernel, loaded through pyximport
+"""
+
+from libc.math cimport sqrt
+from libc.stdint cimport int64_t
+
+cdef inline double _dist(double[:, ::1] pts, int64_t a, int64_t b) nogil:
+    """Euclidean distance between points a and b"""
+    cdef double dx = pts[a, 0] - pts[b, 0]
+    cdef double dy = pts[a, 1] - pts[b, 1]
+    return sqrt(dx*dx + dy*dy)
+
+cpdef int two_opt_c(double[:, ::1] pts, int64_t[::1] path, int iterations):
+    """
+    First-improvement 2-opt with don't-look bits, modifying path in place.
+    Returns the number of passes made.
+    """
+    cdef Py_ssize_t n = path.shape[0]
+    cdef Py_ssize_t i, j, lo, hi, k
+    cdef int64_t a, b, c, d, tmp
+    cdef double delta
+    cdef bint improved, found, full_pass
+    cdef int iter_count = 0
+
+    # Points whose incident edges have not changed since they last
+    # failed to yield an improving move are skipped
+    cdef unsigned char[::1] dont_look = bytearray(pts.shape[0])
+
+    with nogil:
+        while iter_count < iterations:
+            improved = False
+            iter_count += 1
+            full_pass = True
+            for k in range(pts.shape[0]):
+                if dont_look[k]:
+                    full_pass = False
+                    break
+
+            for i in range(1, n - 1):
+                if dont_look[path[i]]:
+                    continue
+
+                found = False
+                for j in range(i + 1, n):
+                    a = path[i-1]
+                    b = path[i]
+                    c = path[j]
+                    d = path[(j + 1) % n]
+
+                    delta = (_dist(pts, a, c) + _dist(pts, b, d) -
+                             _dist(pts, a, b) - _dist(pts, c, d))
+
+                    if delta < -1e-12:
+                        # Reverse path[i:j+1] in place
+                        lo = i
+                        hi = j
+                        while lo < hi:
+                            tmp = path[lo]
+                            path[lo] = path[hi]
+                            path[hi] = tmp
+                            lo += 1
+                            hi -= 1
+
+                        dont_look[a] = 0
+                        dont_look[b] = 0
+                        dont_look[c] = 0
+                        dont_look[d] = 0
+                        improved = True
+                        found = True
+
+                if not found:
+                    dont_look[path[i]] = 1
+
+            if not improved:
+                # Stop once a pass over every point finds nothing,
+                # otherwise recheck the skipped points
+                if full_pass:
+                    break
+                dont_look[:] = 0
+
+    return iter_count
@@ -3,10 +3,21 @@ Voronoi Mosaic - Algorithmic Art
 Creates a beautiful Voronoi diagram with gradient coloring
 """
 
+import re
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.spatial import Voronoi, voronoi_plot_2d
-from matplotlib.collections import PolyCollection
+from scipy.spatial import Voronoi, voronoi_plot_2d, cKDTree
+from matplotlib.collections import LineCollection, PolyCollection
+
+# Shapely is optional; without it only the closed scipy regions are filled.
+# voronoi_polygons(ordered=True) needs shapely 2.1 built against GEOS 3.12
+try:
+    import shapely
+    HAS_SHAPELY = (tuple(map(int, re.match(r'(\d+)\.(\d+)',
+                                           shapely.__version__).groups())) >= (2, 1)
+                   and shapely.geos_version >= (3, 12, 0))
+except ImportError:
+    HAS_SHAPELY = False
 
 # Parameters
 NUM_POINTS = 150
@@ -16,16 +27,79 @@ BACKGROUND = '#0a0a0a'
 EDGE_COLOR = '#ffffff'
 EDGE_WIDTH = 0.5
 EDGE_ALPHA = 0.3
+RASTER_MIN_POINTS = 100000  # From this many points, fill cells as one raster image
+BACKEND = 'scipy'  # 'scipy', or 'gpu' to label the raster with fast_gpu_voronoi (OpenCL)
+GPU_MIN_POINTS = 2000  # The GPU backend is only used from this many points up
 DPI = 150
 OUTPUT_FILE = 'voronoi_mosaic.jpg'
+SEED = None  # Set an int for a reproducible mosaic
+
+# The GPU backend needs fast_gpu_voronoi, which creates its OpenCL context
+# on import; without the package or a usable OpenCL device the cKDTree
+# raster is used instead. pyopencl's errors derive from pyopencl.Error,
+# not the builtin RuntimeError, so both are caught
+HAS_GPU_VORONOI = False
+if BACKEND == 'gpu':
+    try:
+        import pyopencl
+        from fast_gpu_voronoi import Instance
+        from fast_gpu_voronoi.jfa import JFA_star
+        HAS_GPU_VORONOI = True
+        print("Using the fast_gpu_voronoi (OpenCL) backend")
+    except ImportError:
+        print("fast_gpu_voronoi not installed, using the cKDTree backend")
+    except (RuntimeError, pyopencl.Error) as error:
+        print(f"No usable OpenCL device ({error}), using the cKDTree backend")
+
+def voronoi_cells(points, vor):
+    """
+    Vertex arrays of the Voronoi cells, with a mask of which points got one.
+    """
+    if HAS_SHAPELY:
+        # Cell of every point in input order, clipped to the canvas in GEOS
+        canvas = shapely.box(-GRID_SIZE, -GRID_SIZE, GRID_SIZE, GRID_SIZE)
+        cells = shapely.get_parts(shapely.voronoi_polygons(
+            shapely.multipoints(points), extend_to=canvas, ordered=True))
+        cells = shapely.intersection(cells, canvas)
+        
+        # Split the flat exterior coordinates back into one array per cell
+        coords, owner = shapely.get_coordinates(
+            shapely.get_exterior_ring(cells), return_index=True)
+        polygons = np.split(coords, np.flatnonzero(np.diff(owner)) + 1)
+        return polygons, np.ones(len(points), dtype=bool)
+    
+    # Region of each point, skipping open regions that reach infinity
+    regions = [vor.regions[r] for r in vor.point_region]
+    closed = np.array([len(r) > 0 and -1 not in r for r in regions])
+    polygons = [vor.vertices[r] for r, c in zip(regions, closed) if c]
+    return polygons, closed
+
+def nearest_seeds(points, res, gpu=False):
+    """Index of the nearest seed for every pixel of a res x res canvas grid"""
+    if gpu:
+        # Jump flooding over seeds snapped to pixels; labels are 1-based
+        # and the label matrix is indexed [x, y]
+        pixels = np.rint((points + GRID_SIZE) / (2 * GRID_SIZE) * (res - 1))
+        instance = Instance(alg=JFA_star, x=res, y=res,
+                            pts=pixels.astype(np.uint16))
+        instance.run()
+        return instance.M[:, :, 0].T.astype(np.intp) - 1
+    
+    coords = np.linspace(-GRID_SIZE, GRID_SIZE, res)
+    xx, yy = np.meshgrid(coords, coords)
+    _, nearest = cKDTree(points).query(
+        np.column_stack([xx.ravel(), yy.ravel()]), workers=-1)
+    return nearest.reshape(res, res)
 
 def create_voronoi_mosaic():
     """Create Voronoi diagram with gradient coloring"""
     
     print("Generating Voronoi diagram...")
     
-    # Generate random points
-    points = np.random.uniform(-GRID_SIZE, GRID_SIZE, (NUM_POINTS, 2))
+    # Generate random points from a PCG64 generator, fresh each run so SEED
+    # reproduces the mosaic
+    rng = np.random.default_rng(SEED)
+    points = rng.uniform(-GRID_SIZE, GRID_SIZE, (NUM_POINTS, 2))
     
     # Create Voronoi diagram
     vor = Voronoi(points)
@@ -38,37 +112,32 @@ def create_voronoi_mosaic():
     # Get colormap
     cmap = plt.get_cmap(COLORMAP)
     
-    # Plot each Voronoi region
-    for i, region_index in enumerate(vor.point_region):
-        region = vor.regions[region_index]
-        
-        if not -1 in region and len(region) > 0:
-            polygon = [vor.vertices[i] for i in region]
-            
-            # Calculate distance from center for color
-            center_dist = np.linalg.norm(points[i])
-            max_dist = GRID_SIZE * np.sqrt(2)
-            color_val = center_dist / max_dist
-            
-            # Color based on distance from center
-            color = cmap(color_val)
-            
-            # Plot filled polygon
-            poly = plt.Polygon(polygon, facecolor=color, 
-                             edgecolor=EDGE_COLOR, 
-                             linewidth=EDGE_WIDTH,
-                             alpha=0.8)
-            ax.add_patch(poly)
+    # Color based on distance from center, for all points at once
+    max_dist = GRID_SIZE * np.sqrt(2)
+    center_dist = np.linalg.norm(points, axis=1) / max_dist
+    colors = cmap(center_dist)
+    
+    use_gpu = HAS_GPU_VORONOI and NUM_POINTS >= GPU_MIN_POINTS
+    if use_gpu or NUM_POINTS >= RASTER_MIN_POINTS:
+        # Color every pixel by its nearest seed instead of drawing polygons
+        image = colors[nearest_seeds(points, 12 * DPI, use_gpu)]
+        ax.imshow(image, extent=[-GRID_SIZE, GRID_SIZE, -GRID_SIZE, GRID_SIZE],
+                  origin='lower', interpolation='nearest', alpha=0.8)
+    else:
+        # Plot all filled polygons as a single collection
+        polygons, closed = voronoi_cells(points, vor)
+        pc = PolyCollection(polygons, facecolors=colors[closed],
+                           edgecolors=EDGE_COLOR, linewidths=EDGE_WIDTH,
+                           alpha=0.8)
+        ax.add_collection(pc)
     
-    # Add edge lines with transparency
-    for simplex in vor.ridge_vertices:
-        if -1 not in simplex:
-            line = [vor.vertices[i] for i in simplex]
-            ax.plot([line[0][0], line[1][0]], 
-                   [line[0][1], line[1][1]], 
-                   color=EDGE_COLOR, 
-                   linewidth=EDGE_WIDTH,
-                   alpha=EDGE_ALPHA)
+    # Add edge lines with transparency, all finite ridges in one collection
+    ridge_vertices = np.asarray(vor.ridge_vertices, dtype=np.intp)
+    finite = (ridge_vertices >= 0).all(axis=1)
+    ridges = vor.vertices[ridge_vertices[finite]]
+    lc = LineCollection(ridges, colors=EDGE_COLOR,
+                       linewidths=EDGE_WIDTH, alpha=EDGE_ALPHA)
+    ax.add_collection(lc)
     
     # Styling
     ax.set_xlim(-GRID_SIZE, GRID_SIZE)